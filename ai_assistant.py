@@ -1,16 +1,74 @@
 import json
+import requests
 from openai import OpenAI, AzureOpenAI
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import re
+import threading
 from config import Config
-from github_client import GitHubClient
-from ai_tools import AITools
+from github_client import GitHubClient, get_shared_session
+from ai_tools import AITools, TOOL_SCHEMAS
+
+# Caps concurrent model requests across parallel ticket workers to stay within rate/TPM limits
+_model_call_semaphore = threading.BoundedSemaphore(Config.MODEL_MAX_CONCURRENCY)
+
+# Tool schemas converted to the OpenAI function format once, not on every model call
+OPENAI_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": tool_schema["name"],
+            "description": tool_schema["description"],
+            "parameters": tool_schema["input_schema"]
+        }
+    }
+    for tool_schema in TOOL_SCHEMAS
+]
+
+def test_model_connection(model_provider: str = 'openai', azure_config: Optional[Dict[str, Any]] = None,
+                          timeout: float = 3.0) -> bool:
+    """
+    Check that the selected model provider accepts our credentials
+    
+    Args:
+        model_provider: 'openai', 'azure' or 'openrouter'
+        azure_config: Resolved Azure configuration (required for 'azure')
+        timeout: Seconds to wait for the provider to respond
+        
+    Returns:
+        True if the provider accepts the credentials, False otherwise
+    """
+    try:
+        if model_provider == 'openrouter':
+            # OpenRouter's model listing is public, so check the key itself instead
+            response = get_shared_session().get(
+                "https://openrouter.ai/api/v1/key",
+                headers={"Authorization": f"Bearer {Config.OPENROUTER_API_KEY}"},
+                timeout=timeout
+            )
+            response.raise_for_status()
+            return True
+        
+        if model_provider == 'azure':
+            client = AzureOpenAI(
+                api_key=azure_config['api_key'],
+                azure_endpoint=azure_config['endpoint'],
+                api_version=azure_config['api_version']
+            )
+        else:
+            client = OpenAI(api_key=Config.OPENAI_API_KEY)
+        
+        client.with_options(timeout=timeout, max_retries=0).models.list()
+        return True
+    except Exception as e:
+        print(f"Model provider connection test failed: {str(e)}")
+        return False
 
 class AIAssistant:
     def __init__(self, repo_owner: str, repo_name: str, github_token: Optional[str] = None, 
                  branch_name: Optional[str] = None, objective: Optional[str] = None, 
-                 azure_tier: str = 'auto', model_provider: str = 'openai', openrouter_model: Optional[str] = None):
+                 azure_tier: str = 'auto', model_provider: str = 'openai', openrouter_model: Optional[str] = None,
+                 session: Optional[requests.Session] = None, azure_config: Optional[Dict[str, Any]] = None):
         self.repo_owner = repo_owner
         self.repo_name = repo_name
         
@@ -18,7 +76,8 @@ class AIAssistant:
         self.model_provider = model_provider
         
         if model_provider == 'azure':
-            azure_config = Config.get_azure_config(azure_tier)
+            # Reuse configuration already resolved by the caller, otherwise resolve it from the tier
+            azure_config = azure_config or Config.get_azure_config(azure_tier)
             if not azure_config:
                 raise ValueError("Azure configuration not found for the specified tier.")
             
@@ -54,26 +113,36 @@ class AIAssistant:
             self.model_name = Config.OPENAI_MODEL
             self.azure_tier = None
         
-        # Initialize GitHub client
-        self.github_client = GitHubClient(github_token)
+        # Initialize GitHub client (uses the shared pooled session unless one is given)
+        self.github_client = GitHubClient(github_token, session=session)
         
+        # Set up branch, tools and conversation history for the initial task
+        self.reset_for_new_task(branch_name, objective)
+
+    def reset_for_new_task(self, branch_name: Optional[str] = None, objective: Optional[str] = None):
+        """
+        Prepare this assistant for another task on the same repository
+
+        Keeps the model and GitHub clients (and their connections) but starts a
+        fresh branch, tool state and conversation history.
+
+        Args:
+            branch_name: Branch to work on (generated from the objective if omitted)
+            objective: The objective for the new task
+        """
         # Generate branch name if not provided
-        if not branch_name:
-            if objective:
-                self.branch_name = self._generate_branch_name(objective)
-            else:
-                # Fallback to timestamp if no objective provided
-                timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                self.branch_name = f"ai-dev/task-{timestamp}"
-        else:
+        if branch_name:
             self.branch_name = branch_name
-        
-        # Initialize tools with the branch
-        self.ai_tools = AITools(repo_owner, repo_name, self.github_client, self.branch_name)
-        
-        # Conversation history
+        elif objective:
+            self.branch_name = self._generate_branch_name(objective)
+        else:
+            # Fallback to timestamp if no objective provided
+            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            self.branch_name = f"ai-dev/task-{timestamp}"
+
+        self.ai_tools = AITools(self.repo_owner, self.repo_name, self.github_client, self.branch_name)
         self.conversation_history = []
-        
+
     def _generate_branch_name(self, objective: str) -> str:
         """
         Generate a descriptive branch name from the objective
@@ -152,24 +221,13 @@ Continue working until the objective is completed. Be thorough and methodical in
         Make a call to OpenAI API with function calling support
         """
         try:
-            # Convert tool schemas to OpenAI function format
-            tools = []
-            for tool_schema in self.ai_tools.get_tool_schemas():
-                tools.append({
-                    "type": "function",
-                    "function": {
-                        "name": tool_schema["name"],
-                        "description": tool_schema["description"],
-                        "parameters": tool_schema["input_schema"]
-                    }
-                })
-            
-            response = self.openai_client.chat.completions.create(
-                model=self.model_name,
-                messages=messages,
-                tools=tools,
-                tool_choice="auto"
-            )
+            with _model_call_semaphore:
+                response = self.openai_client.chat.completions.create(
+                    model=self.model_name,
+                    messages=messages,
+                    tools=OPENAI_TOOLS,
+                    tool_choice="auto"
+                )
             
             return {
                 "message": response.choices[0].message,
@@ -2,6 +2,122 @@ from typing import Dict, Any, List, Optional
 from github_client import GitHubClient
 import os
 
+# Static tool definitions, built once at import and shared by every AITools instance
+TOOL_SCHEMAS = [
+    {
+        "name": "get_directory",
+        "description": "Retrieve the contents of a directory. If no directory_path is provided, shows the top level directory.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "directory_path": {
+                    "type": "string",
+                    "description": "Path to the directory to explore (optional - defaults to top level)"
+                }
+            }
+        }
+    },
+    {
+        "name": "read_file",
+        "description": "Read the contents of a specified file",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the file to be read"
+                }
+            },
+            "required": ["file_path"]
+        }
+    },
+    {
+        "name": "update_file",
+        "description": "Update the contents of a specified file",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the file to be updated"
+                },
+                "content": {
+                    "type": "string",
+                    "description": "New content for the file"
+                }
+            },
+            "required": ["file_path", "content"]
+        }
+    },
+    {
+        "name": "add_file",
+        "description": "Create a new file with the specified content",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the file to be created"
+                },
+                "content": {
+                    "type": "string",
+                    "description": "Content for the new file"
+                }
+            },
+            "required": ["file_path", "content"]
+        }
+    },
+    {
+        "name": "make_dir",
+        "description": "Create a new directory with a .gitkeep file to maintain the directory structure",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "directory_path": {
+                    "type": "string",
+                    "description": "Path to the directory to be created"
+                }
+            },
+            "required": ["directory_path"]
+        }
+    },
+    {
+        "name": "change_dir",
+        "description": "Change the current working directory",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "directory_path": {
+                    "type": "string",
+                    "description": "Path to the target directory"
+                }
+            },
+            "required": ["directory_path"]
+        }
+    },
+    {
+        "name": "finish_task",
+        "description": "Call this function when you have completed the objective and are ready to finish. Provide a summary of what was accomplished.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "summary": {
+                    "type": "string",
+                    "description": "A brief summary of what was accomplished and any important notes"
+                },
+                "success": {
+                    "type": "boolean",
+                    "description": "Whether the objective was successfully completed"
+                }
+            },
+            "required": ["summary", "success"]
+        }
+    }
+]
+
+# Tool definitions keyed by name for direct lookup
+TOOL_SCHEMAS_BY_NAME = {schema["name"]: schema for schema in TOOL_SCHEMAS}
+
 class AITools:
     def __init__(self, repo_owner: str, repo_name: str, github_client: GitHubClient, branch: str = "main"):
         self.repo_owner = repo_owner
@@ -333,117 +449,13 @@ class AITools:
         """
         Get the schema definitions for all available tools
         """
-        return [
-            {
-                "name": "get_directory",
-                "description": "Retrieve the contents of a directory. If no directory_path is provided, shows the top level directory.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "directory_path": {
-                            "type": "string",
-                            "description": "Path to the directory to explore (optional - defaults to top level)"
-                        }
-                    }
-                }
-            },
-            {
-                "name": "read_file",
-                "description": "Read the contents of a specified file",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Path to the file to be read"
-                        }
-                    },
-                    "required": ["file_path"]
-                }
-            },
-            {
-                "name": "update_file",
-                "description": "Update the contents of a specified file",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Path to the file to be updated"
-                        },
-                        "content": {
-                            "type": "string",
-                            "description": "New content for the file"
-                        }
-                    },
-                    "required": ["file_path", "content"]
-                }
-            },
-            {
-                "name": "add_file",
-                "description": "Create a new file with the specified content",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Path to the file to be created"
-                        },
-                        "content": {
-                            "type": "string",
-                            "description": "Content for the new file"
-                        }
-                    },
-                    "required": ["file_path", "content"]
-                }
-            },
-            {
-                "name": "make_dir",
-                "description": "Create a new directory with a .gitkeep file to maintain the directory structure",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "directory_path": {
-                            "type": "string",
-                            "description": "Path to the directory to be created"
-                        }
-                    },
-                    "required": ["directory_path"]
-                }
-            },
-            {
-                "name": "change_dir",
-                "description": "Change the current working directory",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "directory_path": {
-                            "type": "string",
-                            "description": "Path to the target directory"
-                        }
-                    },
-                    "required": ["directory_path"]
-                }
-            },
-            {
-                "name": "finish_task",
-                "description": "Call this function when you have completed the objective and are ready to finish. Provide a summary of what was accomplished.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "summary": {
-                            "type": "string",
-                            "description": "A brief summary of what was accomplished and any important notes"
-                        },
-                        "success": {
-                            "type": "boolean",
-                            "description": "Whether the objective was successfully completed"
-                        }
-                    },
-                    "required": ["summary", "success"]
-                }
-            }
-        ]
+        return TOOL_SCHEMAS
+    
+    def get_tool_schema(self, tool_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the schema definition for a single tool, or None if it doesn't exist
+        """
+        return TOOL_SCHEMAS_BY_NAME.get(tool_name)
     
     def get_modified_files(self) -> List[Dict[str, str]]:
         """
@@ -1,12 +1,30 @@
 import os
+import functools
+from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
+class ConfigError(Exception):
+    """Raised when required configuration values are missing"""
+    pass
+
+# Bound shared by the memoized epic/repo/owner lookups; epic and repo names come
+# from Jira, so an unbounded cache could grow with every distinct name seen
+_LOOKUP_CACHE_SIZE = 1024
+
+def _index_epics_by_lowercase(epic_map: dict) -> dict:
+    """Map each lowercased epic name to the first mapped name that produces it, in mapping order"""
+    index = {}
+    for epic in epic_map:
+        index.setdefault(epic.lower(), epic)
+    return index
+
 class Config:
     # GitHub API settings
     GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
     GITHUB_API_BASE = 'https://api.github.com'
+    GITHUB_POOL_SIZE = int(os.getenv('GITHUB_POOL_SIZE', '32'))
     
     # Azure OpenAI Low Configuration (Current/Default)
     AZURE_OPENAI_LOW_API_KEY = os.getenv('AZURE_OPENAI_LOW_API_KEY', os.getenv('AZURE_OPENAI_API_KEY'))
@@ -33,10 +51,17 @@ class Config:
     # OpenRouter settings
     OPENROUTER_API_KEY = os.getenv('OPENROUTER_API_KEY')
     
+    # Maximum number of model requests in flight at once (shared by parallel ticket workers)
+    MODEL_MAX_CONCURRENCY = int(os.getenv('MODEL_MAX_CONCURRENCY', '4'))
+    
     # Jira settings
     JIRA_URL = os.getenv('JIRA_URL')
     JIRA_USERNAME = os.getenv('JIRA_USERNAME')
     JIRA_TOKEN = os.getenv('JIRA_TOKEN')
+    JIRA_POOL_SIZE = int(os.getenv('JIRA_POOL_SIZE', '10'))
+    # Issues requested per search page (servers may cap this lower, e.g. Jira Cloud returns at most 100)
+    JIRA_SEARCH_PAGE_SIZE = int(os.getenv('JIRA_SEARCH_PAGE_SIZE', '1000'))
+    JIRA_CONFIGURED = bool(JIRA_URL and JIRA_USERNAME and JIRA_TOKEN)
     
     # Default repository owner
     DEFAULT_REPO_OWNER = 'AJFrio'
@@ -53,6 +78,10 @@ class Config:
         # 'Your Epic Name': 'your-repo-name',
     }
     
+    # Lowercased epic name -> mapped epic name, built once for case-insensitive lookups
+    # (the first mapping wins when two names differ only by case)
+    _EPIC_LOWER_MAP = _index_epics_by_lowercase(EPIC_TO_REPO_MAP)
+    
     # Default repository name for epics not in the mapping
     DEFAULT_REPO_NAME = 'Rep-Shopify-Theme'
     
@@ -124,42 +153,115 @@ class Config:
         return None
     
     @classmethod
-    def get_repo_for_epic(cls, epic_name: str) -> str:
+    def validate(cls, *, need_github: bool = True, need_jira: bool = False,
+                 provider: Optional[str] = None, azure_tier: str = 'auto',
+                 github_token: Optional[str] = None) -> None:
         """
-        Get the repository name for a given epic name
+        Check every setting required for a run in a single pass
+        
+        Args:
+            need_github: Whether a GitHub token is required
+            need_jira: Whether Jira credentials are required
+            provider: Model provider to check ('openai', 'azure', 'openrouter'), or None to skip
+            azure_tier: Azure OpenAI tier to check when provider is 'azure'
+            github_token: GitHub token passed on the command line, if any
+            
+        Raises:
+            ConfigError: Listing all missing settings
+        """
+        missing = []
+        
+        if need_jira:
+            missing.extend(name for name in ('JIRA_URL', 'JIRA_USERNAME', 'JIRA_TOKEN') if not getattr(cls, name))
+        
+        if need_github and not (github_token or cls.GITHUB_TOKEN):
+            missing.append('GITHUB_TOKEN')
+        
+        if provider == 'azure':
+            if not cls.get_azure_config(azure_tier):
+                prefix = 'AZURE_OPENAI' if azure_tier == 'auto' else f"AZURE_OPENAI_{azure_tier.upper()}"
+                missing.append(f"{prefix}_API_KEY/{prefix}_ENDPOINT")
+        elif provider == 'openrouter':
+            if not cls.OPENROUTER_API_KEY:
+                missing.append('OPENROUTER_API_KEY')
+        elif provider is not None:
+            if not cls.OPENAI_API_KEY:
+                missing.append('OPENAI_API_KEY')
+        
+        if missing:
+            raise ConfigError(f"Missing required configuration: {', '.join(missing)}")
+    
+    @classmethod
+    def refresh_epic_mappings(cls) -> None:
+        """Rebuild the epic index and clear cached lookups after changing the mapping dictionaries at runtime"""
+        cls._EPIC_LOWER_MAP = _index_epics_by_lowercase(cls.EPIC_TO_REPO_MAP)
+        cls.match_epic.cache_clear()
+        cls.get_repo_for_epic.cache_clear()
+        cls.get_owner_for_repo.cache_clear()
+    
+    @classmethod
+    @functools.lru_cache(maxsize=_LOOKUP_CACHE_SIZE)
+    def match_epic(cls, epic_name: str) -> tuple:
+        """
+        Find which EPIC_TO_REPO_MAP entry an epic name resolves to
         
         Args:
             epic_name: The name of the epic
             
         Returns:
-            Repository name mapped to the epic, or default if not found
+            Tuple of (mapped epic name or None, match type) where match type is
+            'exact', 'case-insensitive', 'partial', 'empty' or 'default'
         """
         if not epic_name:
-            return cls.DEFAULT_REPO_NAME
+            return None, 'empty'
         
         # Try exact match first
         if epic_name in cls.EPIC_TO_REPO_MAP:
-            return cls.EPIC_TO_REPO_MAP[epic_name]
+            return epic_name, 'exact'
         
         # Try case-insensitive match
         epic_lower = epic_name.lower()
-        for mapped_epic, repo in cls.EPIC_TO_REPO_MAP.items():
-            if mapped_epic.lower() == epic_lower:
-                return repo
+        mapped_epic = cls._EPIC_LOWER_MAP.get(epic_lower)
+        if mapped_epic:
+            return mapped_epic, 'case-insensitive'
+        
+        # Try partial match (if epic name contains any of the mapped epic names);
+        # the index keeps mapping order, so the first matching entry wins
+        for mapped_lower, mapped_epic in cls._EPIC_LOWER_MAP.items():
+            if mapped_lower in epic_lower or epic_lower in mapped_lower:
+                return mapped_epic, 'partial'
+        
+        return None, 'default'
+    
+    @classmethod
+    @functools.lru_cache(maxsize=_LOOKUP_CACHE_SIZE)
+    def get_repo_for_epic(cls, epic_name: str) -> str:
+        """
+        Get the repository name for a given epic name
         
-        # Try partial match (if epic name contains any of the mapped epic names)
-        for mapped_epic, repo in cls.EPIC_TO_REPO_MAP.items():
-            if mapped_epic.lower() in epic_lower or epic_lower in mapped_epic.lower():
-                return repo
+        Results are memoized; call refresh_epic_mappings() after changing
+        EPIC_TO_REPO_MAP at runtime.
         
-        # Return default if no match found
-        return cls.DEFAULT_REPO_NAME
+        Args:
+            epic_name: The name of the epic
+            
+        Returns:
+            Repository name mapped to the epic, or default if not found
+        """
+        mapped_epic, _ = cls.match_epic(epic_name)
+        if mapped_epic is None:
+            return cls.DEFAULT_REPO_NAME
+        return cls.EPIC_TO_REPO_MAP[mapped_epic]
     
     @classmethod
+    @functools.lru_cache(maxsize=_LOOKUP_CACHE_SIZE)
     def get_owner_for_repo(cls, repo_name: str) -> str:
         """
         Get the GitHub owner/organization for a given repository name
         
+        Results are memoized; call refresh_epic_mappings() after changing
+        REPO_TO_OWNER_MAP at runtime.
+        
         Args:
             repo_name: The name of the repository
             
@@ -170,4 +272,4 @@ class Config:
             return cls.REPO_TO_OWNER_MAP[repo_name]
         
         # Return default owner if no specific mapping found
-        return cls.DEFAULT_REPO_OWNER 
\ No newline at end of file
+        return cls.DEFAULT_REPO_OWNER 
@@ -1,11 +1,43 @@
 import requests
 import base64
+import functools
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Any, Optional
 from config import Config
 
+@functools.lru_cache(maxsize=None)
+def get_shared_session() -> requests.Session:
+    """
+    Get the process-wide session used for GitHub API calls
+    
+    Keep-alive connections are pooled so TLS handshakes are paid once per run,
+    and transient errors (429, 502, 503, 504) are retried with backoff.
+    
+    Returns:
+        A shared requests.Session
+    """
+    retry = Retry(
+        total=5,
+        connect=1,  # An unreachable host fails fast instead of backing off
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True
+    )
+    adapter = HTTPAdapter(
+        pool_connections=Config.GITHUB_POOL_SIZE,
+        pool_maxsize=Config.GITHUB_POOL_SIZE,
+        max_retries=retry
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 class GitHubClient:
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Optional[str] = None, session: Optional[requests.Session] = None):
         self.token = token or Config.GITHUB_TOKEN
+        self.session = session or get_shared_session()
         self.base_url = Config.GITHUB_API_BASE
         self.headers = {
             'Authorization': f'token {self.token}',
@@ -21,7 +53,7 @@ class GitHubClient:
         params = {"ref": branch} if branch != "main" else {}
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, headers=self.headers, params=params)
             response.raise_for_status()
             
             contents = response.json()
@@ -50,7 +82,7 @@ class GitHubClient:
         params = {"ref": branch} if branch != "main" else {}
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, headers=self.headers, params=params)
             response.raise_for_status()
             
             file_data = response.json()
@@ -73,7 +105,7 @@ class GitHubClient:
         url = f"{self.base_url}/repos/{repo_owner}/{repo_name}"
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers)
             response.raise_for_status()
             
             repo_data = response.json()
@@ -102,7 +134,7 @@ class GitHubClient:
         url = f"{self.base_url}/repos/{repo_owner}/{repo_name}/git/refs/heads/{branch}"
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers)
             response.raise_for_status()
             
             ref_data = response.json()
@@ -117,7 +149,7 @@ class GitHubClient:
                     # Try to list available branches
                     try:
                         branches_url = f"{self.base_url}/repos/{repo_owner}/{repo_name}/branches"
-                        branches_response = requests.get(branches_url, headers=self.headers)
+                        branches_response = self.session.get(branches_url, headers=self.headers)
                         if branches_response.status_code == 200:
                             branches = branches_response.json()
                             for b in branches:
@@ -137,7 +169,7 @@ class GitHubClient:
         # First, verify repository access
         repo_url = f"{self.base_url}/repos/{repo_owner}/{repo_name}"
         try:
-            repo_response = requests.get(repo_url, headers=self.headers)
+            repo_response = self.session.get(repo_url, headers=self.headers)
             repo_response.raise_for_status()
             print(f"✅ Repository access confirmed")
             
@@ -154,7 +186,7 @@ class GitHubClient:
         
         # Check token scopes
         try:
-            user_response = requests.get(f"{self.base_url}/user", headers=self.headers)
+            user_response = self.session.get(f"{self.base_url}/user", headers=self.headers)
             if user_response.status_code == 200:
                 scopes = user_response.headers.get('X-OAuth-Scopes', '')
                 print(f"Token scopes: {scopes}")
@@ -194,7 +226,7 @@ class GitHubClient:
         }
         
         try:
-            response = requests.post(url, headers=self.headers, json=data)
+            response = self.session.post(url, headers=self.headers, json=data)
             if response.status_code == 201:
                 print(f"✅ Created new branch: {new_branch}")
                 return True
@@ -235,7 +267,7 @@ class GitHubClient:
         }
         
         try:
-            response = requests.put(url, headers=self.headers, json=data)
+            response = self.session.put(url, headers=self.headers, json=data)
             response.raise_for_status()
             return True
             
@@ -251,7 +283,7 @@ class GitHubClient:
         params = {"ref": branch} if branch != "main" else {}
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, headers=self.headers, params=params)
             response.raise_for_status()
             
             file_data = response.json()
@@ -277,7 +309,7 @@ class GitHubClient:
         }
         
         try:
-            response = requests.post(url, headers=self.headers, json=data)
+            response = self.session.post(url, headers=self.headers, json=data)
             response.raise_for_status()
             
             pr_data = response.json()
@@ -285,4 +317,22 @@ class GitHubClient:
             
         except requests.exceptions.RequestException as e:
             print(f"Error creating pull request: {e}")
-            return None 
\ No newline at end of file
+            return None
+    
+    def test_connection(self, timeout: float = 3.0) -> bool:
+        """
+        Check that the GitHub token is accepted
+        
+        Args:
+            timeout: Seconds to wait for GitHub to respond
+            
+        Returns:
+            True if the token authenticates, False otherwise
+        """
+        try:
+            response = self.session.get(f"{self.base_url}/user", headers=self.headers, timeout=timeout)
+            response.raise_for_status()
+            return True
+        except requests.exceptions.RequestException as e:
+            print(f"GitHub connection test failed: {e}")
+            return False
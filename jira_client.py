@@ -6,11 +6,32 @@ This module provides functionality to connect to Jira and process tickets
 with specific labels for AI automation.
 """
 
-from jira import JIRA
-from typing import List, Dict, Optional
+from jira import JIRA, Issue
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+import functools
+from typing import List, Dict, Optional, Tuple
 import logging
+import re
 from config import Config
 
+# Custom fields that commonly hold the epic link
+EPIC_LINK_FIELDS = ['customfield_10014', 'customfield_10008', 'epic']
+
+# Only the fields _extract_ticket_data reads, so searches don't pull '*all'
+TICKET_FIELDS = [
+    'summary', 'description', 'status', 'labels', 'issuetype',
+    'assignee', 'reporter', 'created', 'updated', 'parent'
+] + EPIC_LINK_FIELDS
+
+# Only the fields get_all_epics reads
+EPIC_FIELDS = ['summary', 'status']
+
+# Retries for calls after the first one; the jira library backs off 20-60s per retry
+JIRA_MAX_RETRIES = 3
+
+ISSUE_KEY_PATTERN = re.compile(r'^[A-Z][A-Z0-9_]+-\d+$')
+
 class JiraClient:
     """Client for interacting with Jira API"""
     
@@ -19,6 +40,7 @@ class JiraClient:
         self.server = server or Config.JIRA_URL
         self.username = username or Config.JIRA_USERNAME
         self.token = token or Config.JIRA_TOKEN
+        self.current_user = None  # Filled in by a successful test_connection()
         
         if not all([self.server, self.username, self.token]):
             raise ValueError("Jira credentials are required: JIRA_URL, JIRA_USERNAME, JIRA_TOKEN")
@@ -27,18 +49,33 @@ class JiraClient:
         try:
             self.jira = JIRA(
                 server=self.server,
-                basic_auth=(self.username, self.token)
+                basic_auth=(self.username, self.token),
+                # Fetch search results in large pages so big result sets need fewer round trips
+                default_batch_sizes={Issue: Config.JIRA_SEARCH_PAGE_SIZE},
+                # Fail the initial server-info call right away if Jira is unreachable
+                max_retries=0
             )
+            # Once connected, ride out rate limits and brief outages as usual
+            self.jira._session.max_retries = JIRA_MAX_RETRIES
+            
+            # Reuse pooled keep-alive connections for every Jira call made by this client
+            adapter = HTTPAdapter(
+                pool_connections=Config.JIRA_POOL_SIZE,
+                pool_maxsize=Config.JIRA_POOL_SIZE
+            )
+            self.jira._session.mount('https://', adapter)
+            self.jira._session.mount('http://', adapter)
             logging.info(f"Successfully connected to Jira: {self.server}")
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Jira: {str(e)}")
     
-    def get_tickets_with_label(self, label: str = "UseAI") -> List[Dict]:
+    def get_tickets_with_label(self, label: str = "UseAI", exclude_done: bool = False) -> List[Dict]:
         """
         Get all tickets with a specific label
         
         Args:
             label: The label to search for (default: "UseAI")
+            exclude_done: Skip tickets whose status is in the Done category
             
         Returns:
             List of ticket dictionaries with relevant information
@@ -46,17 +83,22 @@ class JiraClient:
         try:
             # JQL query to find tickets with the specified label
             jql_query = f'labels = "{label}"'
+            if exclude_done:
+                jql_query += ' AND statusCategory != Done'
             
             # Get all issues matching the query
             issues = self.jira.search_issues(
                 jql_query,
                 maxResults=False,  # Get all results
-                expand='names'
+                fields=list(TICKET_FIELDS)  # The jira library may rewrite the list in place
             )
             
+            # Resolve every linked epic in one search instead of one fetch per ticket
+            epic_names = self._get_epic_names(issues)
+            
             tickets = []
             for issue in issues:
-                ticket_data = self._extract_ticket_data(issue)
+                ticket_data = self._extract_ticket_data(issue, epic_names)
                 tickets.append(ticket_data)
             
             logging.info(f"Found {len(tickets)} tickets with label '{label}'")
@@ -78,7 +120,7 @@ class JiraClient:
         """
         try:
             # Get the specific issue
-            issue = self.jira.issue(ticket_key, expand='names')
+            issue = self.jira.issue(ticket_key, fields=','.join(TICKET_FIELDS))
             
             ticket_data = self._extract_ticket_data(issue)
             
@@ -89,12 +131,45 @@ class JiraClient:
             logging.error(f"Error fetching ticket '{ticket_key}': {str(e)}")
             return None
     
-    def _extract_ticket_data(self, issue) -> Dict:
+    def _get_epic_names(self, issues) -> Optional[Dict[str, str]]:
+        """
+        Fetch the names of all epics linked from the given issues in a single search
+        
+        Args:
+            issues: Jira issue objects
+            
+        Returns:
+            Dictionary mapping epic key to epic name, or None if the lookup failed
+        """
+        epic_keys = set()
+        for issue in issues:
+            for field_name in EPIC_LINK_FIELDS:
+                epic_field = getattr(issue.fields, field_name, None)
+                if isinstance(epic_field, str) and ISSUE_KEY_PATTERN.match(epic_field):
+                    epic_keys.add(epic_field)
+        
+        if not epic_keys:
+            return {}
+        
+        try:
+            epics = self.jira.search_issues(
+                f"key in ({', '.join(sorted(epic_keys))})",
+                maxResults=False,
+                fields=['summary']
+            )
+            return {epic.key: epic.fields.summary for epic in epics}
+        except Exception as e:
+            logging.warning(f"Could not batch fetch epics, falling back to per-ticket lookups: {str(e)}")
+            return None
+    
+    def _extract_ticket_data(self, issue, epic_names: Optional[Dict[str, str]] = None) -> Dict:
         """
         Extract relevant data from a Jira issue
         
         Args:
             issue: Jira issue object
+            epic_names: Optional epic key to name mapping from _get_epic_names;
+                        when omitted, linked epics are fetched individually
             
         Returns:
             Dictionary with ticket information
@@ -111,11 +186,18 @@ class JiraClient:
                 epic_key = issue.fields.parent.key
         
         # Try custom field for epic link (common field names)
-        epic_link_fields = ['customfield_10014', 'customfield_10008', 'epic']
-        for field_name in epic_link_fields:
+        for field_name in EPIC_LINK_FIELDS:
             if hasattr(issue.fields, field_name):
                 epic_field = getattr(issue.fields, field_name)
                 if epic_field:
+                    if epic_names is not None:
+                        # Epics were prefetched; anything unresolved is already a name
+                        if isinstance(epic_field, str) and epic_field in epic_names:
+                            epic_name = epic_names[epic_field]
+                            epic_key = epic_field
+                        else:
+                            epic_name = str(epic_field)
+                        break
                     try:
                         # Try to get the epic issue
                         epic_issue = self.jira.issue(epic_field)
@@ -161,7 +243,8 @@ class JiraClient:
             
             issues = self.jira.search_issues(
                 jql_query,
-                maxResults=False
+                maxResults=False,
+                fields=list(EPIC_FIELDS)
             )
             
             epics = []
@@ -181,15 +264,20 @@ class JiraClient:
             logging.error(f"Error fetching epics: {str(e)}")
             raise
     
-    def process_useai_tickets(self) -> List[Dict]:
+    def process_useai_tickets(self, tickets: Optional[List[Dict]] = None) -> List[Dict]:
         """
         Process all tickets with UseAI label and prepare them for AI processing
         
+        Args:
+            tickets: Tickets already returned by get_tickets_with_label("UseAI");
+                     when omitted, open (not Done) UseAI tickets are searched for here
+        
         Returns:
             List of processed tickets ready for AI automation
         """
         try:
-            tickets = self.get_tickets_with_label("UseAI")
+            if tickets is None:
+                tickets = self.get_tickets_with_label("UseAI", exclude_done=True)
             
             processed_tickets = []
             for ticket in tickets:
@@ -262,6 +350,26 @@ The AI Dev has completed the automated work for this ticket. Please review the p
 
         return self.add_comment_to_ticket(ticket_key, comment_text)
     
+    def add_pr_link_comments(self, comments: List[Tuple[str, str, str, str]], max_workers: int = 8) -> List[bool]:
+        """
+        Add PR link comments to several Jira tickets at once
+        
+        Jira has no bulk endpoint for comments, so the requests are sent
+        concurrently over the client's pooled session.
+        
+        Args:
+            comments: (ticket_key, pr_url, branch_name, repo_name) tuples
+            max_workers: Maximum number of comments posted at the same time
+            
+        Returns:
+            List of booleans, in the same order as comments, indicating success
+        """
+        if not comments:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(len(comments), max_workers)) as executor:
+            return list(executor.map(lambda comment: self.add_pr_link_comment(*comment), comments))
+    
     def test_connection(self) -> bool:
         """
         Test the Jira connection
@@ -272,8 +380,23 @@ The AI Dev has completed the automated work for this ticket. Please review the p
         try:
             # Try to get user info to test connection
             user = self.jira.myself()
+            self.current_user = user
             logging.info(f"Jira connection test successful. User: {user['displayName']}")
             return True
         except Exception as e:
             logging.error(f"Jira connection test failed: {str(e)}")
-            return False 
\ No newline at end of file
+            return False 
+
+
+@functools.lru_cache(maxsize=1)
+def get_jira_client() -> JiraClient:
+    """
+    Get the shared JiraClient configured from Config
+    
+    The client (and its pooled connections) is created on first use and
+    reused for the rest of the process.
+    
+    Returns:
+        The process-wide JiraClient instance
+    """
+    return JiraClient()
@@ -7,17 +7,32 @@ and help complete coding tasks using OpenAI's language models.
 """
 
 import argparse
+import contextlib
+import functools
+import json
 import sys
 import logging
-from config import Config
-from ai_assistant import AIAssistant
-from jira_client import JiraClient
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from datetime import datetime
+from typing import Optional
+from config import Config, ConfigError
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="AI Coding Assistant with GitHub and Jira Integration",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Serializes console output from parallel ticket workers
+_print_lock = threading.Lock()
+
+# Jira key of the ticket the current worker thread is processing, used to prefix its output
+_output_ticket = threading.local()
+
+# Per-thread cache of AI Dev instances keyed by (owner, repo)
+_assistant_cache = threading.local()
+
+# Section dividers for console output
+_DIVIDER = "=" * 50
+_SHORT_DIVIDER = "=" * 40
+
+# Usage examples shown at the end of --help
+_EPILOG = """
 Examples:
   # Process specific repository with objective
   python main.py my-repo "Add error handling to the API endpoints"
@@ -31,6 +46,12 @@ Examples:
   # Process all Jira tickets with UseAI label without adding comments
   python main.py --jira-mode --no-comments
   
+  # Process up to 4 Jira tickets at a time
+  python main.py --jira-mode --max-parallel 4
+  
+  # Write Jira results as JSON lines (progress goes to stderr)
+  python main.py --jira-mode --json > results.jsonl
+  
   # Process specific Jira ticket regardless of UseAI label
   python main.py --ticket REP-123
   python main.py --ticket REP-123 --no-comments --no-pr
@@ -38,6 +59,24 @@ Examples:
   # Test Jira connection
   python main.py --test-jira
         """
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that need a whole number of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once; later main() calls in the same process reuse it"""
+    parser = argparse.ArgumentParser(
+        description="AI Coding Assistant with GitHub and Jira Integration",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
     
     parser.add_argument(
@@ -87,13 +126,16 @@ Examples:
         help="Enable verbose output"
     )
     
-    parser.add_argument(
+    # Run modes are mutually exclusive; argparse rejects combinations like --jira-mode --ticket
+    modes = parser.add_mutually_exclusive_group()
+    
+    modes.add_argument(
         "--jira-mode",
         action="store_true",
         help="Process all Jira tickets with UseAI label"
     )
     
-    parser.add_argument(
+    modes.add_argument(
         "--test-jira",
         action="store_true",
         help="Test Jira connection and exit"
@@ -113,6 +155,19 @@ Examples:
     )
     
     parser.add_argument(
+        "--max-parallel",
+        type=_positive_int,
+        default=1,
+        help="Maximum number of Jira tickets to process in parallel in --jira-mode (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="In --jira-mode, write one JSON line per ticket plus a final summary line to stdout (progress goes to stderr)"
+    )
+    
+    modes.add_argument(
         "--ticket",
         help="Process specific Jira ticket by key (e.g., REP-123) regardless of UseAI label"
     )
@@ -129,6 +184,11 @@ Examples:
         help="Specify the model to use with OpenRouter (e.g., 'anthropic/claude-3-opus')"
     )
     
+    return parser
+
+def main():
+    """Parse the command line and run the selected mode; returns True if it succeeded"""
+    parser = _build_parser()
     args = parser.parse_args()
     
     # Set up logging
@@ -141,52 +201,42 @@ Examples:
     if args.test_jira:
         return test_jira_connection()
     
-    # Handle Jira processing mode
-    if args.jira_mode:
-        return process_jira_tickets(args)
+    # Validate required arguments for GitHub mode
+    jira_run = args.jira_mode or bool(args.ticket)
+    if not jira_run and (not args.repo_name or not args.objective):
+        parser.error("repo_name and objective are required unless using --jira-mode, --test-jira, or --ticket")
     
-    # Handle specific ticket processing mode
-    if args.ticket:
-        return process_specific_ticket(args)
+    if args.json and not args.jira_mode:
+        parser.error("--json is only supported with --jira-mode")
     
-    # Validate required arguments for GitHub mode
-    if not args.repo_name or not args.objective:
-        print("Error: repo_name and objective are required unless using --jira-mode, --test-jira, or --ticket")
-        parser.print_help()
-        sys.exit(1)
+    # Parallel workers sharing one custom branch would overwrite each other's commits
+    if args.branch and args.jira_mode and args.max_parallel > 1:
+        parser.error("--branch cannot be combined with --max-parallel greater than 1")
     
-    # Validate required environment variables
-    if not Config.GITHUB_TOKEN and not args.github_token:
-        print("Error: GitHub token is required. Set GITHUB_TOKEN environment variable or use --github-token")
-        sys.exit(1)
+    # In JSON mode stdout carries only JSON lines; everything human-readable goes to stderr
+    json_stream = sys.stdout if args.json else None
+    with contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext():
+        # Validate all credentials up front, before any AI or Jira client is imported
+        purpose = "Jira processing" if args.jira_mode else "ticket processing" if args.ticket else None
+        try:
+            azure_config = _validate_providers(args, need_jira=jira_run, purpose=purpose)
+        except ConfigError as e:
+            print(f"❌ {e}")
+            print("Set the missing values in your .env file (or use --github-token for GitHub)")
+            _emit_json_summary(json_stream, 0, [], [], [], False, error=str(e))
+            return False
+        
+        if args.jira_mode:
+            return process_jira_tickets(args, azure_config, json_stream)
     
-    # Check for OpenAI configuration with new provider system
-    if args.model_provider == 'azure':
-        azure_config = Config.get_azure_config(args.azure_tier)
-        if azure_config:
-            tier_name = azure_config['tier'].upper()
-            print(f"✅ Azure OpenAI configured ({tier_name} tier)")
-            print(f"   Endpoint: {azure_config['endpoint']}")
-            print(f"   Deployment: {azure_config['deployment']}")
-        else:
-            print("Error: Azure OpenAI configuration not found for the specified tier.")
-            sys.exit(1)
-    elif args.model_provider == 'openrouter':
-        if Config.OPENROUTER_API_KEY:
-            print("✅ OpenRouter configured")
-            if args.openrouter_model:
-                print(f"   Model: {args.openrouter_model}")
-            else:
-                print("   Model: anthropic/claude-3-haiku (default)")
-        else:
-            print("Error: OpenRouter configuration not found. Please set OPENROUTER_API_KEY.")
-            sys.exit(1)
-    else: # Default to OpenAI
-        if Config.OPENAI_API_KEY:
-            print("✅ OpenAI configured")
-        else:
-            print("Error: No OpenAI configuration found. Please set OPENAI_API_KEY.")
-            sys.exit(1)
+    if args.ticket:
+        return process_specific_ticket(args, azure_config)
+    return process_objective(args, azure_config)
+
+def process_objective(args, azure_config=None):
+    """Run the AI Dev on a single repository objective (azure_config is the pre-resolved Azure settings, if any); returns True on success"""
+    # Import the AI stack only once we know it is needed
+    from ai_assistant import AIAssistant
     
     # Initialize the AI Dev
     try:
@@ -197,18 +247,21 @@ Examples:
             branch_name=args.branch,
             objective=args.objective,
             azure_tier=args.azure_tier,
+            azure_config=azure_config,
             model_provider=args.model_provider,
             openrouter_model=args.openrouter_model
         )
         
-        print("🤖 AI Coding Assistant")
-        print("=" * 50)
-        print(f"Repository: {args.owner}/{args.repo_name}")
-        print(f"Objective: {args.objective}")
-        print(f"Branch: {assistant.branch_name}")
-        print(f"Max Iterations: {args.max_iterations}")
-        print(f"Create PR: {'No' if args.no_pr else 'Yes'}")
-        print("=" * 50)
+        print("\n".join([
+            "🤖 AI Coding Assistant",
+            _DIVIDER,
+            f"Repository: {args.owner}/{args.repo_name}",
+            f"Objective: {args.objective}",
+            f"Branch: {assistant.branch_name}",
+            f"Max Iterations: {args.max_iterations}",
+            f"Create PR: {'No' if args.no_pr else 'Yes'}",
+            _DIVIDER
+        ]))
         
         # Execute the objective
         result = assistant.execute_objective(
@@ -218,26 +271,31 @@ Examples:
         )
         
         # Print results
+        lines = []
         if result["success"]:
-            print("\n✅ SUCCESS!")
-            print(f"Task completed in {result['iterations']} iterations")
-            print(f"Branch: {result['branch']}")
+            lines.append("\n✅ SUCCESS!")
+            lines.append(f"Task completed in {result['iterations']} iterations")
+            lines.append(f"Branch: {result['branch']}")
             
             if result.get('pull_request_url'):
-                print(f"Pull Request: {result['pull_request_url']}")
+                lines.append(f"Pull Request: {result['pull_request_url']}")
             
             if args.verbose:
-                print("\nFinal Response:")
-                print(result["final_response"])
+                lines.append("\nFinal Response:")
+                lines.append(result["final_response"])
         else:
-            print("\n❌ FAILED!")
-            print(f"Error: {result['error']}")
+            lines.append("\n❌ FAILED!")
+            lines.append(f"Error: {result['error']}")
             if result.get('branch'):
-                print(f"Work was saved on branch: {result['branch']}")
+                lines.append(f"Work was saved on branch: {result['branch']}")
             
         # Show conversation summary if verbose
         if args.verbose:
-            print("\n" + assistant.get_conversation_summary())
+            lines.append("\n" + assistant.get_conversation_summary())
+        
+        print("\n".join(lines))
+        
+        return result["success"]
             
     except KeyboardInterrupt:
         print("\n\nOperation cancelled by user")
@@ -246,35 +304,187 @@ Examples:
         print(f"\nUnexpected error: {str(e)}")
         sys.exit(1)
 
+def jira_branch_name(jira_key: str, timestamp: str = None) -> str:
+    """
+    Build the default branch name for a Jira ticket
+    
+    Args:
+        jira_key: The Jira ticket key (e.g., REP-123)
+        timestamp: A precomputed YYYYMMDD-HHMMSS stamp to share across tickets; defaults to now
+    
+    Returns:
+        Branch name in the form ai-dev-{TICKET-KEY}-{YYYYMMDD-HHMMSS}
+    """
+    return f"ai-dev-{jira_key}-{timestamp or datetime.now().strftime('%Y%m%d-%H%M%S')}"
+
+def _emit(lines):
+    """Write a block of lines to stdout in one locked write so parallel workers never interleave"""
+    with _print_lock:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+def _emit_json(stream, record):
+    """Write a single compact JSON line to stream under the print lock"""
+    with _print_lock:
+        stream.write(json.dumps(record, separators=(',', ':')) + "\n")
+        stream.flush()
+
+class _TicketPrefixedStream:
+    """
+    Stdout wrapper used when tickets run in parallel
+    
+    Output from a ticket worker is collected per thread and written a whole line
+    at a time, prefixed with the ticket's Jira key, so progress printed by the AI
+    Dev and GitHub client can be attributed to its ticket. Output from other
+    threads passes straight through.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._lock = threading.Lock()
+        self._pending = threading.local()
+    
+    def write(self, text: str) -> int:
+        ticket = getattr(_output_ticket, 'key', None)
+        if not ticket:
+            with self._lock:
+                return self._stream.write(text)
+        
+        # Hold back a trailing partial line until the rest of it arrives
+        buffered = getattr(self._pending, 'text', '') + text
+        *lines, self._pending.text = buffered.split("\n")
+        if lines:
+            block = "".join(f"[{ticket}] {line}\n" if line else "\n" for line in lines)
+            with self._lock:
+                self._stream.write(block)
+        return len(text)
+    
+    def flush(self):
+        ticket = getattr(_output_ticket, 'key', None)
+        partial = getattr(self._pending, 'text', '')
+        with self._lock:
+            if ticket and partial:
+                self._stream.write(f"[{ticket}] {partial}")
+                self._pending.text = ''
+            self._stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+def _validate_providers(args, need_jira: bool = False, purpose: str = None) -> Optional[dict]:
+    """
+    Validate the credentials required for the selected mode and model provider
+    
+    Prints a status line for the resolved provider.
+    
+    Args:
+        args: Parsed command line arguments
+        need_jira: Whether Jira credentials are required
+        purpose: Optional description used in status messages (e.g. "Jira processing")
+        
+    Returns:
+        The resolved Azure configuration when using Azure, otherwise None
+        
+    Raises:
+        ConfigError: If any required setting is missing
+    """
+    # Check all required settings in one pass so every missing value is reported together
+    Config.validate(
+        need_jira=need_jira,
+        provider=args.model_provider,
+        azure_tier=args.azure_tier,
+        github_token=args.github_token
+    )
+    
+    # Report the resolved model provider
+    suffix = f" for {purpose}" if purpose else ""
+    azure_config = None
+    if args.model_provider == 'azure':
+        azure_config = Config.get_azure_config(args.azure_tier)
+        tier_name = azure_config['tier'].upper()
+        print(f"✅ Using Azure OpenAI ({tier_name} tier){suffix}")
+        print(f"   Endpoint: {azure_config['endpoint']}")
+        print(f"   Deployment: {azure_config['deployment']}")
+    elif args.model_provider == 'openrouter':
+        print(f"✅ Using OpenRouter{suffix}")
+        print(f"   Model: {args.openrouter_model or 'anthropic/claude-3-haiku (default)'}")
+    else: # Default to OpenAI
+        print(f"✅ Using OpenAI{suffix}")
+    
+    return azure_config
+
+def _preflight(args, azure_config=None) -> bool:
+    """
+    Probe Jira, GitHub and the model provider concurrently
+    
+    Connecting the shared Jira client is part of the Jira probe, so an
+    unreachable Jira server is reported alongside the other checks.
+    
+    Args:
+        args: Parsed command line arguments
+        azure_config: Pre-resolved Azure settings, if using Azure
+        
+    Returns:
+        True if every service responded, False otherwise
+    """
+    from ai_assistant import test_model_connection
+    from github_client import GitHubClient
+    from jira_client import get_jira_client
+    
+    checks = {
+        'Jira': lambda: get_jira_client().test_connection(),
+        'GitHub': GitHubClient(args.github_token).test_connection,
+        'Model provider': lambda: test_model_connection(args.model_provider, azure_config)
+    }
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {name: executor.submit(check) for name, check in checks.items()}
+    
+    failed = []
+    for name, future in futures.items():
+        error = future.exception()
+        if error is not None:
+            print(f"{name} connection test failed: {error}")
+        if error is not None or not future.result():
+            failed.append(name)
+    if failed:
+        print(f"❌ Preflight check failed for: {', '.join(failed)}")
+        return False
+    return True
+
 def test_jira_connection():
     """Test Jira connection and display information"""
     try:
         print("🔗 Testing Jira Connection")
-        print("=" * 40)
+        print(_SHORT_DIVIDER)
         
         # Check if Jira credentials are configured
-        if not all([Config.JIRA_URL, Config.JIRA_USERNAME, Config.JIRA_TOKEN]):
-            print("❌ Jira credentials not configured!")
+        try:
+            Config.validate(need_github=False, need_jira=True)
+        except ConfigError as e:
+            print(f"❌ {e}")
             print("Please set JIRA_URL, JIRA_USERNAME, and JIRA_TOKEN in your .env file")
             return False
         
         # Test connection
-        jira_client = JiraClient()
+        from jira_client import get_jira_client
+        jira_client = get_jira_client()
         if jira_client.test_connection():
             print("✅ Jira connection successful!")
             
             # Show some basic info
             tickets = jira_client.get_tickets_with_label("UseAI")
-            print(f"📋 Found {len(tickets)} tickets with UseAI label")
+            lines = [f"📋 Found {len(tickets)} tickets with UseAI label"]
             
             if tickets:
-                print("\nTickets with UseAI label:")
+                lines.append("\nTickets with UseAI label:")
                 for ticket in tickets[:5]:  # Show first 5
                     epic_info = f" (Epic: {ticket['epic_name']})" if ticket['epic_name'] else ""
-                    print(f"  • {ticket['key']}: {ticket['title'][:60]}...{epic_info}")
+                    lines.append(f"  • {ticket['key']}: {ticket['title'][:60]}...{epic_info}")
                 
                 if len(tickets) > 5:
-                    print(f"  ... and {len(tickets) - 5} more")
+                    lines.append(f"  ... and {len(tickets) - 5} more")
+            
+            _emit(lines)
             
             return True
         else:
@@ -285,223 +495,358 @@ def test_jira_connection():
         print(f"❌ Error testing Jira connection: {str(e)}")
         return False
 
-def process_jira_tickets(args):
-    """Process all Jira tickets with UseAI label"""
+def process_jira_tickets(args, azure_config=None, json_stream=None):
+    """
+    Process all Jira tickets with UseAI label
+    
+    Args:
+        args: Parsed command line arguments
+        azure_config: Pre-resolved Azure settings, if using Azure
+        json_stream: If given, write one JSON line per ticket and a final summary line here
+                     instead of printing the human-readable summary
+        
+    Returns:
+        True if every ticket succeeded, False otherwise
+    """
+    successful = []
+    failed = []
+    pending = []
+    total = 0
+    interrupted = False
     try:
-        print("🤖 Processing Jira Tickets with UseAI Label")
-        print("=" * 50)
+        print("🤖 Processing Jira Tickets with UseAI Label\n" + _DIVIDER)
         
-        # Check if Jira credentials are configured
-        if not all([Config.JIRA_URL, Config.JIRA_USERNAME, Config.JIRA_TOKEN]):
-            print("❌ Jira credentials not configured!")
-            print("Please set JIRA_URL, JIRA_USERNAME, and JIRA_TOKEN in your .env file")
-            sys.exit(1)
-        
-        # Check GitHub credentials
-        if not Config.GITHUB_TOKEN and not args.github_token:
-            print("❌ GitHub token is required for processing tickets")
-            print("Set GITHUB_TOKEN environment variable or use --github-token")
-            sys.exit(1)
-        
-        # Check for OpenAI configuration with new provider system
-        if args.model_provider == 'azure':
-            azure_config = Config.get_azure_config(args.azure_tier)
-            if azure_config:
-                tier_name = azure_config['tier'].upper()
-                print(f"✅ Using Azure OpenAI ({tier_name} tier) for Jira processing")
-            else:
-                print("Error: Azure OpenAI configuration not found for the specified tier.")
-                sys.exit(1)
-        elif args.model_provider == 'openrouter':
-            if not Config.OPENROUTER_API_KEY:
-                print("Error: OpenRouter configuration not found. Please set OPENROUTER_API_KEY.")
-                sys.exit(1)
-            print("✅ Using OpenRouter for Jira processing")
-        else: # Default to OpenAI
-            if not Config.OPENAI_API_KEY:
-                print("❌ No OpenAI configuration found.")
-                sys.exit(1)
-            print("✅ Using OpenAI for Jira processing")
+        # Make sure every service accepts our credentials before starting any ticket
+        if not _preflight(args, azure_config):
+            _emit_json_summary(json_stream, total, successful, failed, pending, interrupted,
+                               error="Preflight check failed")
+            return False
         
-        # Initialize Jira client
-        jira_client = JiraClient()
+        # Reuse the Jira client the preflight check connected
+        from jira_client import get_jira_client
+        jira_client = get_jira_client()
         
         # Get tickets to process
         processed_tickets = jira_client.process_useai_tickets()
         
         if not processed_tickets:
             print("✅ No tickets with UseAI label found")
+            _emit_json_summary(json_stream, total, successful, failed, pending, interrupted)
             return True
         
         print(f"📋 Found {len(processed_tickets)} tickets to process")
         
-        # Process each ticket
-        results = []
-        for i, ticket in enumerate(processed_tickets, 1):
-            print(f"\n🎯 Processing ticket {i}/{len(processed_tickets)}: {ticket['jira_key']}")
-            
-            # Get the appropriate owner for this repository
-            repo_owner = Config.get_owner_for_repo(ticket['repo'])
-            print(f"   Repository: {repo_owner}/{ticket['repo']}")
-            
-            # Show branch name that will be used
-            if args.branch:
-                branch_name = args.branch
-                print(f"   Branch: {branch_name} (custom)")
-            else:
-                from datetime import datetime
-                timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
-                branch_name = f"ai-dev-{ticket['jira_key']}-{timestamp}"
-                print(f"   Branch: {branch_name}")
-            
-            print(f"   Jira URL: {ticket['jira_url']}")
-            
-            try:
-                # Get the appropriate owner for this repository
-                repo_owner = Config.get_owner_for_repo(ticket['repo'])
-                
-                # Generate branch name with ticket number for Jira mode
-                if args.branch:
-                    # Use custom branch name if specified
-                    branch_name = args.branch
-                else:
-                    # Generate branch name with ticket key
-                    from datetime import datetime
-                    timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
-                    branch_name = f"ai-dev-{ticket['jira_key']}-{timestamp}"
-                
-                # Initialize AI Dev for this ticket
-                assistant = AIAssistant(
-                    repo_owner=repo_owner,
-                    repo_name=ticket['repo'],
-                    github_token=args.github_token,
-                    branch_name=branch_name,
-                    objective=ticket['objective'],
-                    azure_tier=args.azure_tier,
-                    model_provider=args.model_provider,
-                    openrouter_model=args.openrouter_model
-                )
-                
-                # Execute the objective
-                result = assistant.execute_objective(
-                    objective=ticket['objective'],
-                    max_iterations=args.max_iterations,
-                    create_pr=not args.no_pr
-                )
-                
-                # Add Jira info to result
-                result['jira_key'] = ticket['jira_key']
-                result['jira_url'] = ticket['jira_url']
-                results.append(result)
-                
-                # Print result for this ticket
-                if result["success"]:
-                    print(f"   ✅ SUCCESS! Completed in {result['iterations']} iterations")
-                    if result.get('pull_request_url'):
-                        print(f"   🔗 Pull Request: {result['pull_request_url']}")
-                        
-                        # Add comment to Jira ticket with PR link (unless --no-comments is specified)
-                        if not args.no_pr and not args.no_comments:  # Only add comment if PR was actually created and comments not disabled
-                            print(f"   💬 Adding comment to Jira ticket...")
-                            comment_success = jira_client.add_pr_link_comment(
-                                ticket_key=ticket['jira_key'],
-                                pr_url=result['pull_request_url'],
-                                branch_name=branch_name,
-                                repo_name=f"{repo_owner}/{ticket['repo']}"
-                            )
-                            if comment_success:
-                                print(f"   ✅ Comment added to Jira ticket")
-                            else:
-                                print(f"   ⚠️  Failed to add comment to Jira ticket")
-                        elif args.no_comments:
-                            print(f"   💬 Skipping Jira comment (--no-comments flag)")
-                else:
-                    print(f"   ❌ FAILED: {result['error']}")
-                
-            except Exception as e:
-                print(f"   ❌ Error processing ticket: {str(e)}")
-                results.append({
-                    'success': False,
-                    'error': str(e),
-                    'jira_key': ticket['jira_key'],
-                    'jira_url': ticket['jira_url']
-                })
-        
-        # Print summary
-        print("\n" + "=" * 50)
-        print("📊 PROCESSING SUMMARY")
-        print("=" * 50)
+        # PR comments are only posted when a PR is created and comments aren't disabled
+        comments_enabled = not args.no_pr and not args.no_comments
         
-        successful = [r for r in results if r.get('success')]
-        failed = [r for r in results if not r.get('success')]
+        # Each ticket's result is folded into the summary as soon as it finishes, so an
+        # interrupted run still reports (and comments on) every ticket that completed
+        total = len(processed_tickets)
+        if args.max_parallel > 1:
+            interrupted = _run_tickets_parallel(processed_tickets, args, jira_client, azure_config,
+                                                successful, failed, pending, json_stream)
+        else:
+            interrupted = _run_tickets_inline(processed_tickets, args, jira_client, azure_config,
+                                              successful, failed, pending, json_stream)
+        
+        # Post the queued PR-link comments concurrently instead of one per ticket
+        if pending:
+            lines = [f"\n💬 Adding {len(pending)} comment(s) to Jira tickets..."]
+            outcomes = jira_client.add_pr_link_comments([r['pending_comment'] for r in pending])
+            for result, comment_success in zip(pending, outcomes):
+                result['comment_added'] = comment_success
+                if not comment_success:
+                    lines.append(f"   ⚠️  Failed to add comment to {result['jira_key']}")
+            _emit(lines)
+        
+        if json_stream:
+            _emit_json_summary(json_stream, total, successful, failed, pending, interrupted)
+            return not failed and not interrupted
         
-        print(f"Total tickets processed: {len(results)}")
-        print(f"Successful: {len(successful)}")
-        print(f"Failed: {len(failed)}")
+        # Print summary
+        lines = [
+            "\n" + _DIVIDER,
+            "📊 PROCESSING SUMMARY",
+            _DIVIDER,
+            f"Total tickets processed: {len(successful) + len(failed)}"
+            + (f" of {total} (interrupted)" if interrupted else ""),
+            f"Successful: {len(successful)}",
+            f"Failed: {len(failed)}"
+        ]
         
         if successful:
-            print("\n✅ Successful tickets:")
+            lines.append("\n✅ Successful tickets:")
             for result in successful:
                 pr_info = ""
                 if result.get('pull_request_url'):
                     pr_info = f" -> {result.get('pull_request_url')}"
-                    if not args.no_pr and not args.no_comments:
+                    if result.get('comment_added'):
                         pr_info += " (comment added to Jira)"
-                    elif not args.no_pr and args.no_comments:
+                    elif result.get('pending_comment'):
+                        pr_info += " (comment failed)"
+                    elif not comments_enabled:
                         pr_info += " (comment skipped)"
-                print(f"  • {result['jira_key']}{pr_info}")
+                lines.append(f"  • {result['jira_key']}{pr_info}")
         
         if failed:
-            print("\n❌ Failed tickets:")
+            lines.append("\n❌ Failed tickets:")
             for result in failed:
-                print(f"  • {result['jira_key']}: {result.get('error', 'Unknown error')}")
+                lines.append(f"  • {result['jira_key']}: {result.get('error', 'Unknown error')}")
+        
+        print("\n".join(lines))
         
-        return len(failed) == 0  # Return True if all succeeded
+        return not failed and not interrupted  # Return True if all succeeded
         
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interrupted")
+        _emit_json_summary(json_stream, total, successful, failed, pending, True, error="Interrupted")
+        return False
     except Exception as e:
         print(f"\n❌ Unexpected error processing Jira tickets: {str(e)}")
+        _emit_json_summary(json_stream, total, successful, failed, pending, interrupted, error=str(e))
         return False
 
-def process_specific_ticket(args):
-    """Process a specific Jira ticket by key regardless of UseAI label"""
+def _run_tickets_inline(tickets, args, jira_client, azure_config, successful, failed, pending, json_stream=None) -> bool:
+    """
+    Process tickets one at a time on the calling thread
+    
+    Ctrl-C stops the ticket in progress straight away.
+    
+    Returns:
+        True if the run was interrupted
+    """
     try:
-        print(f"🎯 Processing Specific Jira Ticket: {args.ticket}")
-        print("=" * 50)
+        for i, ticket in enumerate(tickets, 1):
+            result = _process_ticket(ticket, args, jira_client, i, len(tickets), azure_config)
+            _record_ticket_result(result, successful, failed, pending, json_stream)
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Interrupted - skipping remaining tickets")
+        return True
+    return False
+
+def _run_tickets_parallel(tickets, args, jira_client, azure_config, successful, failed, pending, json_stream=None) -> bool:
+    """
+    Process tickets on a pool of --max-parallel worker threads
+    
+    On Ctrl-C, queued tickets are cancelled and tickets already running are
+    allowed to finish, since they may already have pushed commits; a second
+    Ctrl-C stops waiting for them.
+    
+    Returns:
+        True if the run was interrupted
+    """
+    interrupted = False
+    collected = set()
+    executor = ThreadPoolExecutor(max_workers=args.max_parallel)
+    # Tag every line a worker prints with its ticket so parallel progress stays readable
+    with contextlib.redirect_stdout(_TicketPrefixedStream(sys.stdout)):
+        futures = [
+            executor.submit(_process_ticket_labelled, ticket, args, jira_client, i, len(tickets), azure_config)
+            for i, ticket in enumerate(tickets, 1)
+        ]
+        try:
+            for future in as_completed(futures):
+                collected.add(future)
+                _record_ticket_result(future.result(), successful, failed, pending, json_stream)
+        except KeyboardInterrupt:
+            interrupted = True
+            print("\n\n⚠️  Interrupted - cancelling queued tickets (running tickets will finish first, Ctrl-C again to stop waiting)")
+            executor.shutdown(wait=False, cancel_futures=True)
+            try:
+                wait(futures)
+            except KeyboardInterrupt:
+                print("\n⚠️  Not waiting for running tickets - they are left out of the summary")
+        finally:
+            executor.shutdown(wait=False)
+    
+    # Tickets that were already running when interrupted may have finished (and opened
+    # PRs) since, so fold them in to get their comments and summary entries
+    for future in futures:
+        if future not in collected and future.done() and not future.cancelled():
+            _record_ticket_result(future.result(), successful, failed, pending, json_stream)
+    
+    return interrupted
+
+def _emit_json_summary(json_stream, total, successful, failed, pending, interrupted, error=None):
+    """
+    Write the final JSON summary line for a Jira run, if JSON output was requested
+    
+    Every exit path writes one, so consumers can tell "no work" (zero counts)
+    from a run that stopped early (error set).
+    
+    Args:
+        json_stream: Stream to write to, or None to do nothing
+        total: Number of tickets found
+        successful: Summaries of successful tickets
+        failed: Summaries of failed tickets
+        pending: Successful tickets that had a Jira comment queued
+        interrupted: Whether the run was interrupted
+        error: Why the run stopped early, if it did
+    """
+    if not json_stream:
+        return
+    _emit_json(json_stream, {
+        'summary': {
+            'processed': len(successful) + len(failed),
+            'total': total,
+            'successful': len(successful),
+            'failed': len(failed),
+            'interrupted': interrupted,
+            'comments_added': [r['jira_key'] for r in pending if r.get('comment_added')],
+            'comments_failed': [r['jira_key'] for r in pending if not r.get('comment_added')],
+            'error': error
+        }
+    })
+
+def _record_ticket_result(result, successful, failed, pending, json_stream=None):
+    """
+    Fold one finished ticket's result into the run summary
+    
+    Args:
+        result: Result dict returned by _process_ticket
+        successful: List collecting summaries of successful tickets
+        failed: List collecting summaries of failed tickets
+        pending: List collecting successful tickets with a queued Jira comment
+        json_stream: If given, also write the ticket's JSON line here
+    """
+    summary = {
+        key: result[key]
+        for key in ('jira_key', 'pull_request_url', 'pending_comment', 'error')
+        if result.get(key)
+    }
+    if json_stream:
+        _emit_json(json_stream, {
+            'jira_key': result['jira_key'],
+            'success': bool(result.get('success')),
+            'pull_request_url': result.get('pull_request_url'),
+            'error': result.get('error')
+        })
+    if result.get('success'):
+        successful.append(summary)
+        if summary.get('pending_comment'):
+            pending.append(summary)
+    else:
+        failed.append(summary)
+
+def _process_ticket_labelled(ticket, *args):
+    """Run _process_ticket with this worker's output tagged by the ticket's Jira key"""
+    _output_ticket.key = ticket['jira_key']
+    try:
+        return _process_ticket(ticket, *args)
+    finally:
+        sys.stdout.flush()
+        _output_ticket.key = None
+
+def _process_ticket(ticket, args, jira_client, position, total, azure_config=None):
+    """Process a single Jira ticket and return its result dict"""
+    pr_enabled = not args.no_pr
+    comments_enabled = pr_enabled and not args.no_comments
+    
+    header = [f"\n🎯 Processing ticket {position}/{total}: {ticket['jira_key']}"]
+    
+    # Get the appropriate owner for this repository
+    repo_owner = Config.get_owner_for_repo(ticket['repo'])
+    header.append(f"   Repository: {repo_owner}/{ticket['repo']}")
+    
+    # Compute the branch name once so the displayed and actual branch always match
+    branch_name = args.branch or jira_branch_name(ticket['jira_key'])
+    header.append(f"   Branch: {branch_name}{' (custom)' if args.branch else ''}")
+    
+    header.append(f"   Jira URL: {ticket['jira_url']}")
+    _emit(header)
+    
+    # Buffer the outcome so parallel workers don't interleave their output
+    lines = [f"\n📌 Result for {ticket['jira_key']}:"]
+    try:
+        # Reuse this worker's AI Dev for the repository if it already has one
+        assistant = _get_assistant(args, repo_owner, ticket['repo'], branch_name, ticket['objective'], azure_config)
         
-        # Check if Jira credentials are configured
-        if not all([Config.JIRA_URL, Config.JIRA_USERNAME, Config.JIRA_TOKEN]):
-            print("❌ Jira credentials not configured!")
-            print("Please set JIRA_URL, JIRA_USERNAME, and JIRA_TOKEN in your .env file")
-            sys.exit(1)
-        
-        # Check GitHub credentials
-        if not Config.GITHUB_TOKEN and not args.github_token:
-            print("❌ GitHub token is required for processing tickets")
-            print("Set GITHUB_TOKEN environment variable or use --github-token")
-            sys.exit(1)
-        
-        # Check for OpenAI configuration with new provider system
-        if args.model_provider == 'azure':
-            azure_config = Config.get_azure_config(args.azure_tier)
-            if azure_config:
-                tier_name = azure_config['tier'].upper()
-                print(f"✅ Using Azure OpenAI ({tier_name} tier) for ticket processing")
-            else:
-                print("Error: Azure OpenAI configuration not found for the specified tier.")
-                sys.exit(1)
-        elif args.model_provider == 'openrouter':
-            if not Config.OPENROUTER_API_KEY:
-                print("Error: OpenRouter configuration not found. Please set OPENROUTER_API_KEY.")
-                sys.exit(1)
-            print("✅ Using OpenRouter for ticket processing")
-        else: # Default to OpenAI
-            if not Config.OPENAI_API_KEY:
-                print("❌ No OpenAI configuration found.")
-                sys.exit(1)
-            print("✅ Using OpenAI for ticket processing")
+        # Execute the objective
+        result = assistant.execute_objective(
+            objective=ticket['objective'],
+            max_iterations=args.max_iterations,
+            create_pr=pr_enabled
+        )
+        
+        # Add Jira info to result
+        result['jira_key'] = ticket['jira_key']
+        result['jira_url'] = ticket['jira_url']
+        
+        # Record result for this ticket
+        if result["success"]:
+            lines.append(f"   ✅ SUCCESS! Completed in {result['iterations']} iterations")
+            if result.get('pull_request_url'):
+                lines.append(f"   🔗 Pull Request: {result['pull_request_url']}")
+                
+                # Queue a Jira comment with the PR link; comments are posted together once all tickets finish
+                if comments_enabled:
+                    result['pending_comment'] = (
+                        ticket['jira_key'],
+                        result['pull_request_url'],
+                        branch_name,
+                        f"{repo_owner}/{ticket['repo']}"
+                    )
+                    lines.append(f"   💬 Jira comment queued")
+                else:
+                    lines.append(f"   💬 Skipping Jira comment (--no-comments flag)")
+        else:
+            lines.append(f"   ❌ FAILED: {result['error']}")
+        
+    except Exception as e:
+        lines.append(f"   ❌ Error processing ticket: {str(e)}")
+        result = {
+            'success': False,
+            'error': str(e),
+            'jira_key': ticket['jira_key'],
+            'jira_url': ticket['jira_url']
+        }
+    
+    _emit(lines)
+    
+    return result
+
+def _get_assistant(args, repo_owner, repo_name, branch_name, objective, azure_config=None):
+    """
+    Get an AI Dev for a repository, reusing one already built by this worker thread
+    
+    Each worker thread keeps its own cache keyed by (owner, repo) so tickets that
+    target the same repository skip rebuilding the model and GitHub clients, while
+    parallel workers never share an instance.
+    """
+    cache = getattr(_assistant_cache, 'assistants', None)
+    if cache is None:
+        cache = _assistant_cache.assistants = {}
+    
+    key = (repo_owner, repo_name)
+    assistant = cache.get(key)
+    if assistant is None:
+        from ai_assistant import AIAssistant
+        assistant = cache[key] = AIAssistant(
+            repo_owner=repo_owner,
+            repo_name=repo_name,
+            github_token=args.github_token,
+            branch_name=branch_name,
+            objective=objective,
+            azure_tier=args.azure_tier,
+            azure_config=azure_config,
+            model_provider=args.model_provider,
+            openrouter_model=args.openrouter_model
+        )
+    else:
+        assistant.reset_for_new_task(branch_name, objective)
+    return assistant
+
+def process_specific_ticket(args, azure_config=None):
+    """Process a specific Jira ticket by key regardless of UseAI label (azure_config is the pre-resolved Azure settings, if any)"""
+    pr_enabled = not args.no_pr
+    comments_enabled = pr_enabled and not args.no_comments
+    
+    try:
+        print(f"🎯 Processing Specific Jira Ticket: {args.ticket}\n" + _DIVIDER)
         
         # Initialize Jira client
-        jira_client = JiraClient()
+        from jira_client import get_jira_client
+        jira_client = get_jira_client()
         
         # Get the specific ticket
         ticket_data = jira_client.get_ticket_by_key(args.ticket)
@@ -510,7 +855,7 @@ def process_specific_ticket(args):
             print(f"❌ Ticket {args.ticket} not found or not accessible")
             return False
         
-        print(f"📋 Found ticket: {ticket_data['key']} - {ticket_data['title']}")
+        lines = [f"📋 Found ticket: {ticket_data['key']} - {ticket_data['title']}"]
         
         # Create objective from title and description
         objective = f"Title: {ticket_data['title']}"
@@ -522,23 +867,19 @@ def process_specific_ticket(args):
         
         # Get the appropriate owner for this repository
         repo_owner = Config.get_owner_for_repo(repo)
-        print(f"   Repository: {repo_owner}/{repo}")
+        lines.append(f"   Repository: {repo_owner}/{repo}")
         
-        # Show branch name that will be used
-        if args.branch:
-            branch_name = args.branch
-            print(f"   Branch: {branch_name} (custom)")
-        else:
-            from datetime import datetime
-            timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
-            branch_name = f"ai-dev-{args.ticket}-{timestamp}"
-            print(f"   Branch: {branch_name}")
+        # Compute the branch name once and reuse it for the assistant and the Jira comment
+        branch_name = args.branch or jira_branch_name(args.ticket)
+        lines.append(f"   Branch: {branch_name}{' (custom)' if args.branch else ''}")
         
-        print(f"   Jira URL: {ticket_data['url']}")
-        print(f"   Epic: {ticket_data['epic_name'] or 'None'}")
+        lines.append(f"   Jira URL: {ticket_data['url']}")
+        lines.append(f"   Epic: {ticket_data['epic_name'] or 'None'}")
+        print("\n".join(lines))
         
         try:
             # Initialize AI Dev for this ticket
+            from ai_assistant import AIAssistant
             assistant = AIAssistant(
                 repo_owner=repo_owner,
                 repo_name=repo,
@@ -546,6 +887,7 @@ def process_specific_ticket(args):
                 branch_name=branch_name,
                 objective=objective,
                 azure_tier=args.azure_tier,
+                azure_config=azure_config,
                 model_provider=args.model_provider,
                 openrouter_model=args.openrouter_model
             )
@@ -554,7 +896,7 @@ def process_specific_ticket(args):
             result = assistant.execute_objective(
                 objective=objective,
                 max_iterations=args.max_iterations,
-                create_pr=not args.no_pr
+                create_pr=pr_enabled
             )
             
             # Print result
@@ -564,7 +906,7 @@ def process_specific_ticket(args):
                     print(f"🔗 Pull Request: {result['pull_request_url']}")
                     
                     # Add comment to Jira ticket with PR link (unless --no-comments is specified)
-                    if not args.no_pr and not args.no_comments:
+                    if comments_enabled:
                         print(f"💬 Adding comment to Jira ticket...")
                         comment_success = jira_client.add_pr_link_comment(
                             ticket_key=args.ticket,
@@ -576,7 +918,7 @@ def process_specific_ticket(args):
                             print(f"✅ Comment added to Jira ticket")
                         else:
                             print(f"⚠️  Failed to add comment to Jira ticket")
-                    elif args.no_comments:
+                    else:
                         print("💬 Skipping Jira comment (--no-comments flag)")
                         
                 return True
@@ -593,4 +935,4 @@ def process_specific_ticket(args):
         return False
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(0 if main() else 1) 
\ No newline at end of file
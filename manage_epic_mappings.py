@@ -6,7 +6,10 @@ This script helps you manage and test epic-to-repository mappings.
 """
 
 from config import Config
-from jira_client import JiraClient
+from jira_client import get_jira_client
+
+# Turns an epic name into a repository slug in a single pass
+_SLUG_TABLE = str.maketrans({' ': '-', '_': '-'})
 
 def show_current_mappings():
     """Display current epic-to-repo mappings"""
@@ -40,37 +43,46 @@ def test_epic_mapping(epic_name: str):
     print(f"  Repository: {owner}/{repo}")
     
     # Show why this mapping was chosen
-    if not epic_name:
+    mapped_epic, match_type = Config.match_epic(epic_name)
+    if match_type == 'empty':
         print(f"  Reason: Empty epic name, using default")
-    elif epic_name in Config.EPIC_TO_REPO_MAP:
+    elif match_type == 'exact':
         print(f"  Reason: Exact match found")
+    elif match_type == 'case-insensitive':
+        print(f"  Reason: Case-insensitive match with '{mapped_epic}'")
+    elif match_type == 'partial':
+        print(f"  Reason: Partial match with '{mapped_epic}'")
     else:
-        # Check for case-insensitive match
-        epic_lower = epic_name.lower()
-        for mapped_epic, mapped_repo in Config.EPIC_TO_REPO_MAP.items():
-            if mapped_epic.lower() == epic_lower:
-                print(f"  Reason: Case-insensitive match with '{mapped_epic}'")
-                return
-            elif mapped_epic.lower() in epic_lower or epic_lower in mapped_epic.lower():
-                print(f"  Reason: Partial match with '{mapped_epic}'")
-                return
-        
         print(f"  Reason: No match found, using default")
 
-def show_jira_epics_with_mappings():
+def fetch_jira_epics():
+    """
+    Fetch all epics from Jira once for the rest of the report
+    
+    Returns:
+        List of epic dictionaries, or None if Jira is not configured or unreachable
+    """
+    # Check if Jira is configured
+    if not Config.JIRA_CONFIGURED:
+        print("\n❌ Jira not configured. Cannot fetch epic information.")
+        return None
+    
+    try:
+        return get_jira_client().get_all_epics()
+    except Exception as e:
+        print(f"\n❌ Error fetching Jira epics: {str(e)}")
+        return None
+
+def show_jira_epics_with_mappings(epics):
     """Show actual Jira epics and their current mappings"""
     print("\n🔗 Jira Epics and Their Mappings")
     print("=" * 50)
     
     try:
-        # Check if Jira is configured
-        if not all([Config.JIRA_URL, Config.JIRA_USERNAME, Config.JIRA_TOKEN]):
-            print("❌ Jira not configured. Cannot fetch epic information.")
+        if epics is None:
+            print("❌ Jira epics unavailable. Cannot show epic information.")
             return
         
-        jira_client = JiraClient()
-        epics = jira_client.get_all_epics()
-        
         if not epics:
             print("ℹ️  No epics found in Jira")
             return
@@ -99,19 +111,16 @@ def show_jira_epics_with_mappings():
     except Exception as e:
         print(f"❌ Error fetching Jira epics: {str(e)}")
 
-def suggest_mappings():
+def suggest_mappings(epics):
     """Suggest epic mappings based on Jira data"""
     print("\n💡 Mapping Suggestions")
     print("=" * 50)
     
     try:
-        if not all([Config.JIRA_URL, Config.JIRA_USERNAME, Config.JIRA_TOKEN]):
-            print("❌ Jira not configured. Cannot provide suggestions.")
+        if epics is None:
+            print("❌ Jira epics unavailable. Cannot provide suggestions.")
             return
         
-        jira_client = JiraClient()
-        epics = jira_client.get_all_epics()
-        
         unmapped_epics = []
         for epic in epics:
             if epic['name'] not in Config.EPIC_TO_REPO_MAP:
@@ -126,7 +135,7 @@ def suggest_mappings():
         print("# Add to EPIC_TO_REPO_MAP in config.py:")
         for epic in unmapped_epics:
             # Suggest a repository name based on epic name
-            suggested_repo = epic['name'].lower().replace(' ', '-').replace('_', '-')
+            suggested_repo = epic['name'].lower().translate(_SLUG_TABLE)
             print(f"'{epic['name']}': '{suggested_repo}',")
         
     except Exception as e:
@@ -155,11 +164,14 @@ def main():
     for test_case in test_cases:
         test_epic_mapping(test_case)
     
+    # Fetch Jira epics once and share them between the report sections
+    epics = fetch_jira_epics()
+    
     # Show actual Jira epics if possible
-    show_jira_epics_with_mappings()
+    show_jira_epics_with_mappings(epics)
     
     # Suggest new mappings
-    suggest_mappings()
+    suggest_mappings(epics)
     
     print("\n📝 How to Add New Mappings:")
     print("=" * 40)
@@ -6,10 +6,53 @@ This script helps debug issues with loading environment variables from .env file
 """
 
 import os
+import re
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dotenv import load_dotenv
 
+# A value wrapped in matching single or double quotes
+QUOTED_VALUE = re.compile(r'^([\'"])(.*)\1$')
+
+RECOMMENDED_ENV_FORMAT = """
+📋 Recommended .env format:
+# No quotes around values
+JIRA_URL=https://your-company.atlassian.net
+JIRA_USERNAME=your_email@company.com
+JIRA_TOKEN=your_jira_api_token_here"""
+
+def mask(value):
+    """Hide a secret, keeping only its length visible"""
+    return '*' * len(value)
+
+def describe_env_line(line_num, line):
+    """Return the manual-parse report lines for one raw .env line (empty for blanks and comments)"""
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return []
+    
+    key, separator, value = line.partition('=')
+    if not separator:
+        return []
+    key = key.strip()
+    value = value.strip()
+    
+    # Remove quotes if present
+    quoted = QUOTED_VALUE.match(value)
+    if quoted:
+        value_unquoted = quoted.group(2)
+        details = [
+            f"  Raw value: {repr(value)}",
+            f"  Unquoted: {repr(value_unquoted)}",
+            f"  Length: {len(value_unquoted)}"
+        ]
+    else:
+        details = [
+            f"  Value: {repr(value)}",
+            f"  Length: {len(value)}"
+        ]
+    return [f"Line {line_num}: {key}", *details, ""]
+
 def debug_env_loading():
     """Debug environment variable loading"""
     
@@ -24,12 +67,14 @@ def debug_env_loading():
         # Read the raw file content
         print(f"\n📄 Raw .env file content:")
         print("-" * 30)
+        # Read the file once: show each raw line now and keep its parse for the manual test below
+        manual_report = []
         try:
             with open(env_file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                for i, line in enumerate(lines, 1):
+                for i, line in enumerate(f, 1):
                     # Show line numbers and raw content
                     print(f"{i:2d}: {repr(line)}")
+                    manual_report.extend(describe_env_line(i, line))
         except Exception as e:
             print(f"❌ Error reading .env file: {e}")
             return
@@ -49,12 +94,14 @@ def debug_env_loading():
         'JIRA_TOKEN': os.getenv('JIRA_TOKEN')
     }
     
+    lines = []
     for var, value in jira_vars_before.items():
         if value:
-            display_value = value if var != 'JIRA_TOKEN' else f"*{'*' * (len(value) - 2)}*"
-            print(f"  {var}: {display_value}")
+            display_value = value if var != 'JIRA_TOKEN' else mask(value)
+            lines.append(f"  {var}: {display_value}")
         else:
-            print(f"  {var}: None")
+            lines.append(f"  {var}: None")
+    print("\n".join(lines))
     
     # Load with dotenv
     load_result = load_dotenv()
@@ -67,65 +114,45 @@ def debug_env_loading():
         'JIRA_TOKEN': os.getenv('JIRA_TOKEN')
     }
     
+    lines = []
     for var, value in jira_vars_after.items():
         if value:
-            display_value = value if var != 'JIRA_TOKEN' else f"*{'*' * (len(value) - 2)}*"
-            print(f"  {var}: {display_value}")
-            print(f"    Length: {len(value)} characters")
-            print(f"    Raw: {repr(value)}")
+            display_value = value if var != 'JIRA_TOKEN' else mask(value)
+            lines.extend([
+                f"  {var}: {display_value}",
+                f"    Length: {len(value)} characters",
+                f"    Raw: {repr(value)}"
+            ])
         else:
-            print(f"  {var}: None")
+            lines.append(f"  {var}: None")
+    print("\n".join(lines))
     
     # Test manual parsing
     print(f"\n🔧 Manual .env parsing test:")
     print("-" * 30)
     
-    try:
-        with open(env_file_path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Remove quotes if present
-                    if (value.startswith('"') and value.endswith('"')) or \
-                       (value.startswith("'") and value.endswith("'")):
-                        value_unquoted = value[1:-1]
-                        print(f"Line {line_num}: {key}")
-                        print(f"  Raw value: {repr(value)}")
-                        print(f"  Unquoted: {repr(value_unquoted)}")
-                        print(f"  Length: {len(value_unquoted)}")
-                    else:
-                        print(f"Line {line_num}: {key}")
-                        print(f"  Value: {repr(value)}")
-                        print(f"  Length: {len(value)}")
-                    print()
-    except Exception as e:
-        print(f"❌ Error in manual parsing: {e}")
+    if manual_report:
+        print("\n".join(manual_report))
     
     # Recommendations
     print("💡 Recommendations:")
     print("-" * 30)
     
     if not jira_vars_after['JIRA_TOKEN']:
-        print("❌ JIRA_TOKEN is still not loaded. Possible issues:")
-        print("  1. Remove quotes around the token value in .env")
-        print("  2. Ensure no extra spaces around the = sign")
-        print("  3. Make sure the line doesn't have Windows line endings (\\r\\n)")
-        print("  4. Try putting the JIRA_TOKEN line at the end of the .env file")
-        print("\n📝 Correct format:")
-        print("JIRA_TOKEN=your_actual_token_without_quotes")
+        print("\n".join([
+            "❌ JIRA_TOKEN is still not loaded. Possible issues:",
+            "  1. Remove quotes around the token value in .env",
+            "  2. Ensure no extra spaces around the = sign",
+            "  3. Make sure the line doesn't have Windows line endings (\\r\\n)",
+            "  4. Try putting the JIRA_TOKEN line at the end of the .env file",
+            "\n📝 Correct format:",
+            "JIRA_TOKEN=your_actual_token_without_quotes"
+        ]))
     else:
         print("✅ JIRA_TOKEN loaded successfully!")
         
     # Show recommended .env format
-    print(f"\n📋 Recommended .env format:")
-    print("# No quotes around values")
-    print("JIRA_URL=https://your-company.atlassian.net")
-    print("JIRA_USERNAME=your_email@company.com")
-    print("JIRA_TOKEN=your_jira_api_token_here")
+    print(RECOMMENDED_ENV_FORMAT)
 
 def main():
     debug_env_loading()
@@ -3,8 +3,9 @@
 Debug script to test repository access and identify issues
 """
 
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from config import Config
+from github_client import get_shared_session
 
 def test_repository_access(repo_owner: str, repo_name: str):
     """Test basic repository access"""
@@ -20,16 +21,25 @@ def test_repository_access(repo_owner: str, repo_name: str):
     
     print(f"✅ GitHub token found (length: {len(Config.GITHUB_TOKEN)})")
     
-    # Test basic GitHub API access
+    # Test basic GitHub API access over one keep-alive session
+    session = get_shared_session()
     headers = {
         'Authorization': f'token {Config.GITHUB_TOKEN}',
         'Accept': 'application/vnd.github.v3+json'
     }
+    repo_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}"
+    branches_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/branches"
+    
+    # The three checks are independent, so send them together and report in order
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        user_future = executor.submit(session.get, 'https://api.github.com/user', headers=headers)
+        repo_future = executor.submit(session.get, repo_url, headers=headers)
+        branches_future = executor.submit(session.get, branches_url, headers=headers)
     
     # Test 1: Check if we can access GitHub API at all
     print("\n1. Testing GitHub API access...")
     try:
-        response = requests.get('https://api.github.com/user', headers=headers)
+        response = user_future.result()
         if response.status_code == 200:
             user_data = response.json()
             print(f"✅ GitHub API access successful")
@@ -44,24 +54,27 @@ def test_repository_access(repo_owner: str, repo_name: str):
     
     # Test 2: Check specific repository access
     print(f"\n2. Testing repository access: {repo_owner}/{repo_name}")
-    repo_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}"
     
     try:
-        response = requests.get(repo_url, headers=headers)
+        response = repo_future.result()
         if response.status_code == 200:
             repo_data = response.json()
-            print(f"✅ Repository access successful")
-            print(f"   Repository: {repo_data.get('full_name')}")
-            print(f"   Private: {repo_data.get('private', False)}")
-            print(f"   Default branch: {repo_data.get('default_branch')}")
-            print(f"   Permissions: {repo_data.get('permissions', {})}")
+            print("\n".join([
+                f"✅ Repository access successful",
+                f"   Repository: {repo_data.get('full_name')}",
+                f"   Private: {repo_data.get('private', False)}",
+                f"   Default branch: {repo_data.get('default_branch')}",
+                f"   Permissions: {repo_data.get('permissions', {})}"
+            ]))
         elif response.status_code == 404:
-            print(f"❌ Repository not found or not accessible")
-            print("   Possible causes:")
-            print("   - Repository doesn't exist")
-            print("   - Repository is private and token lacks access")
-            print("   - Incorrect repository owner/name")
-            print("   - Token doesn't have 'repo' scope")
+            print("\n".join([
+                f"❌ Repository not found or not accessible",
+                "   Possible causes:",
+                "   - Repository doesn't exist",
+                "   - Repository is private and token lacks access",
+                "   - Incorrect repository owner/name",
+                "   - Token doesn't have 'repo' scope"
+            ]))
             return False
         else:
             print(f"❌ Repository access failed: {response.status_code}")
@@ -73,18 +86,16 @@ def test_repository_access(repo_owner: str, repo_name: str):
     
     # Test 3: Check branch access
     print(f"\n3. Testing branch listing...")
-    branches_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/branches"
     
     try:
-        response = requests.get(branches_url, headers=headers)
+        response = branches_future.result()
         if response.status_code == 200:
             branches = response.json()
-            print(f"✅ Branch access successful")
-            print(f"   Found {len(branches)} branches:")
-            for branch in branches[:5]:  # Show first 5 branches
-                print(f"   - {branch['name']}")
+            lines = [f"✅ Branch access successful", f"   Found {len(branches)} branches:"]
+            lines.extend(f"   - {branch['name']}" for branch in branches[:5])  # Show first 5 branches
             if len(branches) > 5:
-                print(f"   ... and {len(branches) - 5} more")
+                lines.append(f"   ... and {len(branches) - 5} more")
+            print("\n".join(lines))
         else:
             print(f"❌ Branch access failed: {response.status_code}")
             return False
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test that an AIAssistant can be reused for another task on the same repository
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from unittest.mock import patch
+from ai_assistant import AIAssistant
+from config import Config
+
+
+class TestAssistantReuse(unittest.TestCase):
+
+    def setUp(self):
+        """Build an assistant without real OpenAI or GitHub clients"""
+        with patch.object(Config, 'OPENAI_API_KEY', 'test-key'), \
+             patch('ai_assistant.OpenAI'), \
+             patch('ai_assistant.GitHubClient'):
+            self.assistant = AIAssistant(
+                repo_owner="test-owner",
+                repo_name="test-repo",
+                branch_name="ai-dev-REP-1",
+                objective="First task"
+            )
+
+    def test_reset_switches_branch_and_clears_state(self):
+        """Test that resetting starts a fresh branch, tool state and conversation"""
+        self.assistant.conversation_history.append({"role": "user", "content": "old"})
+        self.assistant.ai_tools.modified_files.append({"file_path": "a.py", "action": "updated"})
+        openai_client = self.assistant.openai_client
+        github_client = self.assistant.github_client
+
+        self.assistant.reset_for_new_task("ai-dev-REP-2", "Second task")
+
+        self.assertEqual(self.assistant.branch_name, "ai-dev-REP-2")
+        self.assertEqual(self.assistant.ai_tools.branch, "ai-dev-REP-2")
+        self.assertEqual(self.assistant.ai_tools.modified_files, [])
+        self.assertEqual(self.assistant.conversation_history, [])
+        self.assertIs(self.assistant.openai_client, openai_client)
+        self.assertIs(self.assistant.github_client, github_client)
+
+    def test_reset_generates_branch_from_objective(self):
+        """Test that a branch name is generated when none is given"""
+        self.assistant.reset_for_new_task(objective="Add input validation to forms")
+
+        self.assertTrue(self.assistant.branch_name.startswith("ai-dev/"))
+        self.assertIn("validation", self.assistant.branch_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,15 +3,18 @@
 Test script specifically for branch creation debugging
 """
 
-import requests
 import json
 from config import Config
+from github_client import get_shared_session
 
 def test_branch_creation():
     repo_owner = "AJFrio"
     repo_name = "Wholesale-Builder"
     new_branch = "test-branch-debug"
     
+    # Reuse one keep-alive session (with 429/5xx retries) for every step
+    session = get_shared_session()
+    
     headers = {
         'Authorization': f'token {Config.GITHUB_TOKEN}',
         'Accept': 'application/vnd.github.v3+json'
@@ -23,7 +26,7 @@ def test_branch_creation():
     # Step 0: Check token scopes
     print("\n0. Checking token scopes...")
     try:
-        response = requests.get("https://api.github.com/user", headers=headers)
+        response = session.get("https://api.github.com/user", headers=headers)
         if response.status_code == 200:
             scopes = response.headers.get('X-OAuth-Scopes', 'No scopes header')
             print(f"Token scopes: {scopes}")
@@ -37,7 +40,7 @@ def test_branch_creation():
     ref_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/git/refs/heads/main"
     
     try:
-        response = requests.get(ref_url, headers=headers)
+        response = session.get(ref_url, headers=headers)
         print(f"GET {ref_url}")
         print(f"Status: {response.status_code}")
         
@@ -68,7 +71,7 @@ def test_branch_creation():
     print(f"Data: {json.dumps(data, indent=2)}")
     
     try:
-        response = requests.post(create_url, headers=alt_headers, json=data)
+        response = session.post(create_url, headers=alt_headers, json=data)
         print(f"Status: {response.status_code}")
         print(f"Response: {response.text}")
         
@@ -93,7 +96,7 @@ def test_branch_creation():
     }
     
     try:
-        response = requests.post(create_url, headers=cli_headers, json=data)
+        response = session.post(create_url, headers=cli_headers, json=data)
         print(f"Status: {response.status_code}")
         print(f"Response: {response.text}")
         
@@ -113,7 +116,7 @@ def test_branch_creation():
     # Get the latest commit on main
     commits_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/commits/main"
     try:
-        response = requests.get(commits_url, headers=headers)
+        response = session.get(commits_url, headers=headers)
         if response.status_code == 200:
             commit_data = response.json()
             commit_sha = commit_data['sha']
@@ -125,7 +128,7 @@ def test_branch_creation():
                 'sha': commit_sha
             }
             
-            response = requests.post(create_url, headers=headers, json=branch_data)
+            response = session.post(create_url, headers=headers, json=branch_data)
             print(f"Create branch status: {response.status_code}")
             print(f"Response: {response.text}")
             
@@ -5,7 +5,12 @@ Test Branch Naming for Jira Mode
 This script demonstrates how branch names are generated in Jira mode.
 """
 
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from datetime import datetime
+from main import jira_branch_name
 
 def test_branch_naming():
     """Test the branch naming logic for Jira tickets"""
@@ -23,13 +28,16 @@ def test_branch_naming():
     print("🎯 Auto-generated branch names (default behavior):")
     print("-" * 30)
     
+    # One timestamp per run, shared by every ticket
+    timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
     for i, ticket in enumerate(sample_tickets, 1):
-        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
-        branch_name = f"ai-dev-{ticket['jira_key']}-{timestamp}"
-        print(f"{i}. Ticket: {ticket['jira_key']}")
-        print(f"   Title: {ticket['title']}")
-        print(f"   Branch: {branch_name}")
-        print()
+        branch_name = jira_branch_name(ticket['jira_key'], timestamp)
+        print("\n".join([
+            f"{i}. Ticket: {ticket['jira_key']}",
+            f"   Title: {ticket['title']}",
+            f"   Branch: {branch_name}",
+            ""
+        ]))
     
     print("🎯 Custom branch name (when using --branch flag):")
     print("-" * 30)
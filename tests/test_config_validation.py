@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test the single-pass configuration validation in Config.validate
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from unittest.mock import patch
+from config import Config, ConfigError
+
+
+class TestConfigValidation(unittest.TestCase):
+
+    def setUp(self):
+        """Start every test from a fully configured environment"""
+        values = {
+            'GITHUB_TOKEN': 'gh-token',
+            'OPENAI_API_KEY': 'openai-key',
+            'OPENROUTER_API_KEY': 'openrouter-key',
+            'JIRA_URL': 'https://example.atlassian.net',
+            'JIRA_USERNAME': 'user@example.com',
+            'JIRA_TOKEN': 'jira-token',
+        }
+        patchers = [patch.object(Config, name, value) for name, value in values.items()]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_valid_configuration_passes(self):
+        """Test that nothing is raised when all settings are present"""
+        Config.validate(need_jira=True, provider='openai')
+        Config.validate(need_jira=True, provider='openrouter')
+
+    def test_reports_all_missing_settings_together(self):
+        """Test that every missing setting is listed in one error"""
+        with patch.object(Config, 'JIRA_TOKEN', None), \
+             patch.object(Config, 'GITHUB_TOKEN', None), \
+             patch.object(Config, 'OPENAI_API_KEY', None):
+            with self.assertRaises(ConfigError) as ctx:
+                Config.validate(need_jira=True, provider='openai')
+
+        message = str(ctx.exception)
+        self.assertIn('JIRA_TOKEN', message)
+        self.assertIn('GITHUB_TOKEN', message)
+        self.assertIn('OPENAI_API_KEY', message)
+        self.assertNotIn('JIRA_URL', message)
+
+    def test_command_line_github_token_is_accepted(self):
+        """Test that a token passed on the command line satisfies the GitHub check"""
+        with patch.object(Config, 'GITHUB_TOKEN', None):
+            Config.validate(provider='openai', github_token='cli-token')
+
+    def test_optional_checks_are_skipped(self):
+        """Test that Jira, GitHub and provider checks only run when requested"""
+        with patch.object(Config, 'JIRA_URL', None), \
+             patch.object(Config, 'GITHUB_TOKEN', None), \
+             patch.object(Config, 'OPENAI_API_KEY', None):
+            Config.validate(need_github=False)
+
+    def test_missing_azure_tier(self):
+        """Test that a missing Azure tier names the settings for that tier"""
+        with patch.object(Config, 'get_azure_config', return_value=None):
+            with self.assertRaises(ConfigError) as ctx:
+                Config.validate(provider='azure', azure_tier='high')
+
+        self.assertIn('AZURE_OPENAI_HIGH_API_KEY', str(ctx.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
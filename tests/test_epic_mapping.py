@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test epic-to-repository mapping lookups in Config
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from unittest.mock import patch
+from config import Config
+
+
+class TestEpicMapping(unittest.TestCase):
+
+    def setUp(self):
+        """Install a small known mapping and rebuild the lookup index"""
+        mapping = {
+            'Builders - Menu Addition': 'threejs-builder',
+            'Commercial': 'Rep-Shopify-Theme',
+            'E-commerce Platform': 'shop-platform',
+        }
+        patcher = patch.object(Config, 'EPIC_TO_REPO_MAP', mapping)
+        patcher.start()
+        # Cleanups run last-in first-out: restore the mapping, then rebuild the index
+        self.addCleanup(Config.refresh_epic_mappings)
+        self.addCleanup(patcher.stop)
+        Config.refresh_epic_mappings()
+
+    def test_exact_match(self):
+        """Test that an exact epic name maps directly"""
+        self.assertEqual(Config.match_epic('Commercial'), ('Commercial', 'exact'))
+        self.assertEqual(Config.get_repo_for_epic('Commercial'), 'Rep-Shopify-Theme')
+
+    def test_case_insensitive_match(self):
+        """Test that epic names match regardless of case"""
+        self.assertEqual(Config.match_epic('commercial'), ('Commercial', 'case-insensitive'))
+        self.assertEqual(Config.get_repo_for_epic('BUILDERS - MENU ADDITION'), 'threejs-builder')
+
+    def test_partial_match(self):
+        """Test that partial epic names map to the containing entry"""
+        self.assertEqual(Config.match_epic('E-commerce'), ('E-commerce Platform', 'partial'))
+        self.assertEqual(Config.get_repo_for_epic('E-commerce'), 'shop-platform')
+
+    def test_partial_match_prefers_first_mapping(self):
+        """Test that the first mapped entry wins when several partially match"""
+        Config.EPIC_TO_REPO_MAP['Builder - New'] = 'threejs-builder'
+        Config.EPIC_TO_REPO_MAP['New Theme 2024'] = 'new-theme'
+        Config.refresh_epic_mappings()
+
+        self.assertEqual(Config.match_epic('New'), ('Builder - New', 'partial'))
+        self.assertEqual(Config.get_repo_for_epic('New'), 'threejs-builder')
+
+    def test_case_collision_prefers_first_mapping(self):
+        """Test that the first mapped entry wins when two names differ only by case"""
+        Config.EPIC_TO_REPO_MAP['COMMERCIAL'] = 'other-repo'
+        Config.refresh_epic_mappings()
+
+        self.assertEqual(Config.match_epic('commercial'), ('Commercial', 'case-insensitive'))
+
+    def test_default_for_unknown_and_empty(self):
+        """Test that unknown or empty epic names fall back to the default repository"""
+        self.assertEqual(Config.match_epic('Unknown Epic'), (None, 'default'))
+        self.assertEqual(Config.match_epic(''), (None, 'empty'))
+        self.assertEqual(Config.get_repo_for_epic('Unknown Epic'), Config.DEFAULT_REPO_NAME)
+        self.assertEqual(Config.get_repo_for_epic(None), Config.DEFAULT_REPO_NAME)
+
+    def test_refresh_picks_up_runtime_changes(self):
+        """Test that refreshing after editing the mapping updates cached lookups"""
+        self.assertEqual(Config.get_repo_for_epic('New Theme'), Config.DEFAULT_REPO_NAME)
+
+        Config.EPIC_TO_REPO_MAP['New Theme'] = 'new-theme'
+        Config.refresh_epic_mappings()
+
+        self.assertEqual(Config.get_repo_for_epic('new theme'), 'new-theme')
+
+
+    def test_refresh_clears_every_lookup_cache(self):
+        """Test that refreshing invalidates the match, repo and owner caches together"""
+        self.assertEqual(Config.match_epic('Commercial'), ('Commercial', 'exact'))
+        self.assertEqual(Config.get_repo_for_epic('Commercial'), 'Rep-Shopify-Theme')
+        self.assertEqual(Config.get_owner_for_repo('new-theme'), Config.DEFAULT_REPO_OWNER)
+
+        del Config.EPIC_TO_REPO_MAP['Commercial']
+        Config.EPIC_TO_REPO_MAP['Commercial Site'] = 'new-theme'
+        with patch.dict(Config.REPO_TO_OWNER_MAP, {'new-theme': 'new-owner'}):
+            Config.refresh_epic_mappings()
+
+            for lookup in (Config.match_epic, Config.get_repo_for_epic, Config.get_owner_for_repo):
+                self.assertEqual(lookup.cache_info().currsize, 0)
+            self.assertEqual(Config.match_epic('Commercial'), ('Commercial Site', 'partial'))
+            self.assertEqual(Config.get_repo_for_epic('Commercial'), 'new-theme')
+            self.assertEqual(Config.get_owner_for_repo('new-theme'), 'new-owner')
+
+
+if __name__ == "__main__":
+    unittest.main()
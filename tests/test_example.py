@@ -15,7 +15,7 @@ def main():
     
     try:
         # Check if Jira is configured
-        if not all([Config.JIRA_URL, Config.JIRA_USERNAME, Config.JIRA_TOKEN]):
+        if not Config.JIRA_CONFIGURED:
             print("❌ Jira not configured. Please set up your .env file with:")
             print("  JIRA_URL=https://your-company.atlassian.net")
             print("  JIRA_USERNAME=your_email@company.com")
@@ -55,7 +55,8 @@ def main():
         print("\n" + "=" * 40)
         print("Processing tickets for AI automation...")
         
-        processed_tickets = jira_client.process_useai_tickets()
+        # Reuse the tickets fetched above instead of searching again
+        processed_tickets = jira_client.process_useai_tickets(tickets)
         
         if processed_tickets:
             print(f"✅ Processed {len(processed_tickets)} tickets:")
@@ -135,16 +135,16 @@ class TestMakeDirIntegration(unittest.TestCase):
         # Should have 3 .gitkeep files + 4 regular files = 7 total
         self.assertEqual(len(modified_files), 7)
         
-        # Check that we have the right mix of created files
-        gitkeep_files = [f for f in modified_files if f["file_path"].endswith(".gitkeep")]
-        regular_files = [f for f in modified_files if not f["file_path"].endswith(".gitkeep")]
-        
-        self.assertEqual(len(gitkeep_files), 3)  # 3 directories
-        self.assertEqual(len(regular_files), 4)  # 4 files
-        
-        # All should be marked as created
+        # Check that we have the right mix of created files in a single pass
+        gitkeep_count = 0
         for file_info in modified_files:
+            # All should be marked as created
             self.assertEqual(file_info["action"], "created")
+            if file_info["file_path"].endswith(".gitkeep"):
+                gitkeep_count += 1
+        
+        self.assertEqual(gitkeep_count, 3)  # 3 directories
+        self.assertEqual(len(modified_files) - gitkeep_count, 4)  # 4 files
     
     def test_all_tools_available(self):
         """Test that all tools including make_dir are available"""
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test JiraClient's batched epic lookups and concurrent PR link comments without a Jira server
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+from jira_client import JiraClient, TICKET_FIELDS, JIRA_MAX_RETRIES
+
+
+def make_issue(key, **fields):
+    """Build a minimal stand-in for a Jira issue with the fields _extract_ticket_data reads"""
+    defaults = {
+        'summary': f"Summary for {key}",
+        'description': None,
+        'status': SimpleNamespace(name='To Do'),
+        'labels': ['UseAI'],
+        'issuetype': SimpleNamespace(name='Task'),
+        'assignee': None,
+        'reporter': None,
+        'created': '2024-12-01T10:00:00.000+0000',
+        'updated': '2024-12-01T10:00:00.000+0000',
+        'parent': None,
+    }
+    defaults.update(fields)
+    return SimpleNamespace(key=key, fields=SimpleNamespace(**defaults))
+
+
+class TestJiraClient(unittest.TestCase):
+
+    def setUp(self):
+        """Build a client whose JIRA connection is a mock"""
+        with patch('jira_client.JIRA') as jira_class:
+            self.client = JiraClient(server="https://jira.example.com", username="user", token="token")
+        self.jira = self.client.jira
+        self.jira_kwargs = jira_class.call_args[1]
+
+    def test_connect_fails_fast_then_retries(self):
+        """Test that connecting doesn't retry, while later calls get the usual retries"""
+        self.assertEqual(self.jira_kwargs['max_retries'], 0)
+        self.assertEqual(self.jira._session.max_retries, JIRA_MAX_RETRIES)
+
+    def test_prefetched_epic_key_resolves_to_name(self):
+        """Test that an epic key found by the batch search resolves to its name and key"""
+        issue = make_issue("REP-1", customfield_10014="REP-10")
+        epic = make_issue("REP-10", summary="Builder - New")
+        self.jira.search_issues.side_effect = [[issue], [epic]]
+
+        tickets = self.client.get_tickets_with_label()
+
+        self.assertEqual(tickets[0]['epic_name'], "Builder - New")
+        self.assertEqual(tickets[0]['epic_key'], "REP-10")
+        self.assertIn("key in (REP-10)", self.jira.search_issues.call_args[0][0])
+        self.jira.issue.assert_not_called()
+
+    def test_useai_search_skips_done_and_copies_fields(self):
+        """Test that the UseAI search excludes Done tickets and never hands out the shared field list"""
+        self.jira.search_issues.return_value = []
+
+        self.assertEqual(self.client.process_useai_tickets(), [])
+
+        jql = self.jira.search_issues.call_args[0][0]
+        fields = self.jira.search_issues.call_args[1]['fields']
+        self.assertEqual(jql, 'labels = "UseAI" AND statusCategory != Done')
+        self.assertEqual(fields, TICKET_FIELDS)
+        self.assertIsNot(fields, TICKET_FIELDS)
+
+    def test_unresolved_epic_value_is_used_as_name(self):
+        """Test that an epic link value that isn't a prefetched key is treated as the epic name"""
+        issue = make_issue("REP-2", customfield_10014="Commercial")
+
+        ticket = self.client._extract_ticket_data(issue, epic_names={})
+
+        self.assertEqual(ticket['epic_name'], "Commercial")
+        self.assertIsNone(ticket['epic_key'])
+        self.jira.issue.assert_not_called()
+
+    def test_failed_batch_search_falls_back_to_per_ticket_lookup(self):
+        """Test that a failed batch search returns None and epics are fetched one by one"""
+        issue = make_issue("REP-3", customfield_10014="REP-10")
+        self.jira.search_issues.side_effect = Exception("JQL error")
+        self.jira.issue.return_value = make_issue("REP-10", summary="New Theme 2024")
+
+        self.assertIsNone(self.client._get_epic_names([issue]))
+
+        self.jira.search_issues.side_effect = [[issue], Exception("JQL error")]
+        tickets = self.client.get_tickets_with_label()
+
+        self.jira.issue.assert_called_with("REP-10")
+        self.assertEqual(tickets[0]['epic_name'], "New Theme 2024")
+        self.assertEqual(tickets[0]['epic_key'], "REP-10")
+
+    def test_pr_link_comments_keep_input_order(self):
+        """Test that comment results line up with their inputs even when they finish out of order"""
+        delays = {"REP-1": 0.05, "REP-2": 0.0, "REP-3": 0.02}
+
+        def add_comment(ticket_key, comment_text):
+            time.sleep(delays[ticket_key])
+            if ticket_key == "REP-2":
+                raise Exception("Comment rejected")
+
+        self.jira.add_comment.side_effect = add_comment
+        comments = [
+            (key, f"https://github.com/owner/repo/pull/{i}", f"ai-dev-{key}", "owner/repo")
+            for i, key in enumerate(delays, 1)
+        ]
+
+        results = self.client.add_pr_link_comments(comments)
+
+        self.assertEqual(results, [True, False, True])
+        self.assertEqual(self.client.add_pr_link_comments([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,9 +7,20 @@ This script tests the ability to add comments to Jira tickets.
 
 import sys
 import os
+from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import Config
-from jira_client import JiraClient
+from jira_client import get_jira_client
+
+# Example of the comment added to a ticket once its pull request is created
+SAMPLE_COMMENT = """🤖 *AI Dev Update*
+
+✅ *Pull Request Created*
+• Repository: repfitness/threejs-builder
+• Branch: ai-dev-REP-123-20241201-143022
+• Pull Request: https://github.com/repfitness/threejs-builder/pull/42
+
+The AI Dev has completed the automated work for this ticket. Please review the pull request and merge when ready."""
 
 def test_jira_comments():
     """Test adding comments to Jira tickets"""
@@ -18,13 +29,13 @@ def test_jira_comments():
     print("=" * 50)
     
     # Check if Jira is configured
-    if not all([Config.JIRA_URL, Config.JIRA_USERNAME, Config.JIRA_TOKEN]):
+    if not Config.JIRA_CONFIGURED:
         print("❌ Jira not configured. Please set up your .env file.")
         return False
     
     try:
-        # Initialize Jira client
-        jira_client = JiraClient()
+        # Use the shared Jira client
+        jira_client = get_jira_client()
         
         # Test connection first
         if not jira_client.test_connection():
@@ -38,38 +49,33 @@ def test_jira_comments():
         tickets = jira_client.get_tickets_with_label("UseAI")
         
         if not tickets:
-            print("ℹ️  No tickets with 'UseAI' label found for testing")
-            print("\n💡 To test comment functionality:")
-            print("1. Create a ticket in Jira")
-            print("2. Add the 'UseAI' label")
-            print("3. Run this test again")
+            print("\n".join([
+                "ℹ️  No tickets with 'UseAI' label found for testing",
+                "\n💡 To test comment functionality:",
+                "1. Create a ticket in Jira",
+                "2. Add the 'UseAI' label",
+                "3. Run this test again"
+            ]))
             return True
         
         # Show available tickets
-        print(f"📋 Found {len(tickets)} tickets with 'UseAI' label:")
-        for i, ticket in enumerate(tickets, 1):
-            print(f"{i:2d}. {ticket['key']}: {ticket['title']}")
+        lines = [f"📋 Found {len(tickets)} tickets with 'UseAI' label:"]
+        lines.extend(f"{i:2d}. {ticket['key']}: {ticket['title']}" for i, ticket in enumerate(tickets, 1))
+        print("\n".join(lines))
         
         # Test comment formatting
         print(f"\n📝 Example comment that would be added:")
         print("-" * 40)
         
-        sample_comment = f"""🤖 *AI Dev Update*
-
-✅ *Pull Request Created*
-• Repository: repfitness/threejs-builder
-• Branch: ai-dev-REP-123-20241201-143022
-• Pull Request: https://github.com/repfitness/threejs-builder/pull/42
-
-The AI Dev has completed the automated work for this ticket. Please review the pull request and merge when ready."""
-        
-        print(sample_comment)
+        print(SAMPLE_COMMENT)
         print("-" * 40)
         
         # Ask if user wants to test adding a comment
-        print(f"\n🧪 Test Options:")
-        print("1. Run this with --test-comment TICKET-KEY to actually add a test comment")
-        print("2. Or use the real Jira processing with: python main.py --jira-mode")
+        print("\n".join([
+            f"\n🧪 Test Options:",
+            "1. Run this with --test-comment TICKET-KEY to actually add a test comment",
+            "2. Or use the real Jira processing with: python main.py --jira-mode"
+        ]))
         
         return True
         
@@ -84,14 +90,14 @@ def add_test_comment(ticket_key: str):
     print("=" * 50)
     
     try:
-        jira_client = JiraClient()
+        jira_client = get_jira_client()
         
         # Add a test comment
         test_comment = f"""🧪 *Test Comment from AI Dev*
 
 This is a test comment to verify the commenting functionality is working correctly.
 
-Timestamp: {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Timestamp: {datetime.now():%Y-%m-%d %H:%M:%S}
 
 If you can see this comment, the integration is working! 🎉"""
 
@@ -42,7 +42,7 @@ def main():
         else:
             print(f"✅ JIRA_TOKEN: {'*' * len(Config.JIRA_TOKEN)}")
         
-        if not all([Config.JIRA_URL, Config.JIRA_USERNAME, Config.JIRA_TOKEN]):
+        if not Config.JIRA_CONFIGURED:
             print("\n❌ Missing Jira credentials. Please check your .env file.")
             print("Required variables:")
             print("  - JIRA_URL=https://your-company.atlassian.net")
@@ -78,35 +78,42 @@ def main():
             print()
             
             for i, ticket in enumerate(tickets, 1):
-                print(f"{i}. {ticket['key']}: {ticket['title']}")
-                print(f"   Status: {ticket['status']}")
-                print(f"   Type: {ticket['issue_type']}")
+                # Print each ticket as a single block
+                lines = [
+                    f"{i}. {ticket['key']}: {ticket['title']}",
+                    f"   Status: {ticket['status']}",
+                    f"   Type: {ticket['issue_type']}"
+                ]
                 if ticket['epic_name']:
-                    print(f"   Epic: {ticket['epic_name']} ({ticket['epic_key']})")
+                    lines.append(f"   Epic: {ticket['epic_name']} ({ticket['epic_key']})")
                 else:
-                    print(f"   Epic: Not linked")
-                print(f"   URL: {ticket['url']}")
+                    lines.append(f"   Epic: Not linked")
+                lines.append(f"   URL: {ticket['url']}")
                 if ticket['description']:
                     desc_preview = ticket['description'][:100]
                     if len(ticket['description']) > 100:
                         desc_preview += "..."
-                    print(f"   Description: {desc_preview}")
-                print()
+                    lines.append(f"   Description: {desc_preview}")
+                lines.append("")
+                print("\n".join(lines))
         
         print("\n🎯 Testing ticket processing...")
         
         # Test the processing functionality
-        processed_tickets = jira_client.process_useai_tickets()
+        # Reuse the tickets fetched above instead of searching again
+        processed_tickets = jira_client.process_useai_tickets(tickets)
         
         if processed_tickets:
             print(f"✅ Successfully processed {len(processed_tickets)} tickets for AI automation")
             print("\nProcessed tickets:")
             
             for i, ticket in enumerate(processed_tickets, 1):
-                print(f"{i}. {ticket['jira_key']}")
-                print(f"   Repo: {ticket['repo']}")
-                print(f"   Objective: {ticket['objective'][:100]}{'...' if len(ticket['objective']) > 100 else ''}")
-                print()
+                print("\n".join([
+                    f"{i}. {ticket['jira_key']}",
+                    f"   Repo: {ticket['repo']}",
+                    f"   Objective: {ticket['objective'][:100]}{'...' if len(ticket['objective']) > 100 else ''}",
+                    ""
+                ]))
         else:
             print("ℹ️  No tickets ready for processing")
         
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Test Jira mode orchestration in main.py with fake Jira and AI Dev clients
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import io
+import json
+import threading
+import contextlib
+import unittest
+from unittest.mock import patch
+import main
+
+
+class FakeJiraClient:
+    """Stands in for JiraClient, recording the PR link comments it is asked to post"""
+
+    def __init__(self, keys, comment_outcomes=None):
+        self.tickets = [
+            {'jira_key': key, 'jira_url': f"https://jira.example.com/browse/{key}",
+             'objective': f"Title: Work for {key}", 'repo': 'test-repo'}
+            for key in keys
+        ]
+        self.comment_outcomes = comment_outcomes
+        self.comment_calls = []
+        self.finished_when_commenting = None
+        self.finished = set()
+
+    def process_useai_tickets(self):
+        return self.tickets
+
+    def add_pr_link_comments(self, comments):
+        self.comment_calls.append(list(comments))
+        self.finished_when_commenting = set(self.finished)
+        if self.comment_outcomes is not None:
+            return self.comment_outcomes
+        return [True] * len(comments)
+
+
+class FakeAssistant:
+    """Stands in for AIAssistant, returning a scripted outcome per ticket"""
+
+    def __init__(self, jira_client, outcomes, jira_key):
+        self.jira_client = jira_client
+        self.outcomes = outcomes
+        self.jira_key = jira_key
+
+    def execute_objective(self, objective, max_iterations, create_pr):
+        outcome = self.outcomes.get(self.jira_key, 'pr')
+        try:
+            if outcome == 'interrupt':
+                raise KeyboardInterrupt
+            if outcome == 'error':
+                raise RuntimeError(f"Model error on {self.jira_key}")
+            if outcome == 'fail':
+                return {'success': False, 'error': f"Could not finish {self.jira_key}"}
+            return {
+                'success': True,
+                'iterations': 3,
+                'pull_request_url': f"https://github.com/test-owner/test-repo/pull/{self.jira_key}" if create_pr else None
+            }
+        finally:
+            if outcome != 'interrupt':
+                self.jira_client.finished.add(self.jira_key)
+
+
+class TestProcessJiraTickets(unittest.TestCase):
+
+    def run_jira_mode(self, jira_client, outcomes, *argv):
+        """Run process_jira_tickets with fakes; returns (result, JSON records)"""
+        args = main._build_parser().parse_args(['--jira-mode', *argv])
+        json_stream = io.StringIO()
+
+        def get_assistant(args, repo_owner, repo_name, branch_name, objective, azure_config=None):
+            jira_key = objective.split()[-1]
+            return FakeAssistant(jira_client, outcomes, jira_key)
+
+        with patch('jira_client.get_jira_client', return_value=jira_client), \
+             patch.object(main, '_preflight', return_value=True), \
+             patch.object(main, '_get_assistant', side_effect=get_assistant), \
+             contextlib.redirect_stdout(io.StringIO()):
+            result = main.process_jira_tickets(args, json_stream=json_stream)
+
+        records = [json.loads(line) for line in json_stream.getvalue().splitlines()]
+        return result, records
+
+    def test_mixed_outcomes_across_workers(self):
+        """Test that successes and failures from parallel workers are all reported"""
+        jira_client = FakeJiraClient(["REP-1", "REP-2", "REP-3", "REP-4"])
+        outcomes = {"REP-2": 'fail', "REP-3": 'error'}
+
+        result, records = self.run_jira_mode(jira_client, outcomes, '--max-parallel', '2')
+
+        self.assertFalse(result)
+        tickets = {record['jira_key']: record for record in records[:-1]}
+        self.assertEqual(set(tickets), {"REP-1", "REP-2", "REP-3", "REP-4"})
+        self.assertTrue(tickets["REP-1"]['success'])
+        self.assertEqual(tickets["REP-2"]['error'], "Could not finish REP-2")
+        self.assertEqual(tickets["REP-3"]['error'], "Model error on REP-3")
+        summary = records[-1]['summary']
+        self.assertEqual((summary['processed'], summary['successful'], summary['failed']), (4, 2, 2))
+
+    def test_comments_posted_once_after_pool_drains(self):
+        """Test that PR link comments are posted in one batch after every ticket finished"""
+        jira_client = FakeJiraClient(["REP-1", "REP-2", "REP-3"])
+
+        result, records = self.run_jira_mode(jira_client, {}, '--max-parallel', '3')
+
+        self.assertTrue(result)
+        self.assertEqual(len(jira_client.comment_calls), 1)
+        self.assertEqual(jira_client.finished_when_commenting, {"REP-1", "REP-2", "REP-3"})
+        commented = sorted(comment[0] for comment in jira_client.comment_calls[0])
+        self.assertEqual(commented, ["REP-1", "REP-2", "REP-3"])
+
+    def test_partial_comment_failures_follow_comment_order(self):
+        """Test that each comment outcome is attributed to the ticket it was posted for"""
+        jira_client = FakeJiraClient(["REP-1", "REP-2"], comment_outcomes=[False, True])
+
+        result, records = self.run_jira_mode(jira_client, {})
+
+        summary = records[-1]['summary']
+        self.assertEqual(summary['comments_failed'], ["REP-1"])
+        self.assertEqual(summary['comments_added'], ["REP-2"])
+
+    def test_no_comments_flag(self):
+        """Test that --no-comments creates PRs but posts nothing to Jira"""
+        jira_client = FakeJiraClient(["REP-1", "REP-2"])
+
+        result, records = self.run_jira_mode(jira_client, {}, '--no-comments', '--max-parallel', '2')
+
+        self.assertTrue(result)
+        self.assertEqual(jira_client.comment_calls, [])
+        self.assertTrue(all(record['pull_request_url'] for record in records[:-1]))
+        self.assertEqual(records[-1]['summary']['comments_added'], [])
+
+    def test_interrupt_still_comments_on_finished_tickets(self):
+        """Test that an interrupted run comments on, and reports, only the tickets that finished"""
+        jira_client = FakeJiraClient(["REP-1", "REP-2", "REP-3"])
+
+        result, records = self.run_jira_mode(jira_client, {"REP-2": 'interrupt'})
+
+        self.assertFalse(result)
+        self.assertEqual(len(jira_client.comment_calls), 1)
+        [(jira_key, pr_url, branch_name, repo_name)] = jira_client.comment_calls[0]
+        self.assertEqual(jira_key, "REP-1")
+        self.assertEqual(pr_url, "https://github.com/test-owner/test-repo/pull/REP-1")
+        summary = records[-1]['summary']
+        self.assertTrue(summary['interrupted'])
+        self.assertEqual((summary['processed'], summary['total']), (1, 3))
+        self.assertEqual(summary['comments_added'], ["REP-1"])
+
+    def test_parallel_interrupt_collects_running_tickets(self):
+        """Test that tickets still running at Ctrl-C are folded in once they finish"""
+        jira_client = FakeJiraClient(["REP-1", "REP-2", "REP-3"])
+        release = threading.Event()
+        real_as_completed = main.as_completed
+
+        def interrupt_after_first(futures):
+            # Hand back the first finished ticket, then simulate Ctrl-C while REP-2 is still running
+            iterator = real_as_completed(futures)
+            yield next(iterator)
+            release.set()
+            raise KeyboardInterrupt
+
+        original = FakeAssistant.execute_objective
+
+        def slow_second(assistant, *args, **kwargs):
+            if assistant.jira_key == "REP-2":
+                release.wait(5)
+            return original(assistant, *args, **kwargs)
+
+        with patch.object(main, 'as_completed', interrupt_after_first), \
+             patch.object(FakeAssistant, 'execute_objective', slow_second):
+            result, records = self.run_jira_mode(jira_client, {}, '--max-parallel', '2')
+
+        self.assertFalse(result)
+        commented = sorted(comment[0] for comment in jira_client.comment_calls[0])
+        self.assertIn("REP-2", commented)
+        summary = records[-1]['summary']
+        self.assertTrue(summary['interrupted'])
+        self.assertEqual(summary['processed'], len(commented))
+
+
+
+class TestJsonOutput(unittest.TestCase):
+
+    def test_json_mode_writes_only_json_to_stdout(self):
+        """Test that a --json run puts only JSON lines on stdout, ending with the summary"""
+        jira_client = FakeJiraClient(["REP-1", "REP-2", "REP-3"])
+        outcomes = {"REP-3": 'fail'}
+
+        def get_assistant(args, repo_owner, repo_name, branch_name, objective, azure_config=None):
+            return FakeAssistant(jira_client, outcomes, objective.split()[-1])
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with patch.object(sys, 'argv', ['main.py', '--jira-mode', '--json', '--max-parallel', '2']), \
+             patch.object(main.Config, 'validate'), \
+             patch('jira_client.get_jira_client', return_value=jira_client), \
+             patch.object(main, '_preflight', return_value=True), \
+             patch.object(main, '_get_assistant', side_effect=get_assistant), \
+             contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            result = main.main()
+
+        self.assertFalse(result)
+        records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual(sorted(record['jira_key'] for record in records[:-1]), ["REP-1", "REP-2", "REP-3"])
+        summary = records[-1]['summary']
+        summary['comments_added'].sort()
+        self.assertEqual(summary, {
+            'processed': 3,
+            'total': 3,
+            'successful': 2,
+            'failed': 1,
+            'interrupted': False,
+            'comments_added': ["REP-1", "REP-2"],
+            'comments_failed': [],
+            'error': None
+        })
+        # Human-readable progress went to stderr instead
+        self.assertIn("Found 3 tickets to process", stderr.getvalue())
+
+    def test_json_mode_reports_missing_configuration(self):
+        """Test that a configuration error still produces a JSON summary and a failing result"""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with patch.object(sys, 'argv', ['main.py', '--jira-mode', '--json']), \
+             patch.object(main.Config, 'validate', side_effect=main.ConfigError("Missing required configuration: JIRA_URL")), \
+             contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            result = main.main()
+
+        self.assertFalse(result)
+        [record] = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual(record['summary']['error'], "Missing required configuration: JIRA_URL")
+        self.assertEqual(record['summary']['processed'], 0)
+
+
+
+class TestPreflight(unittest.TestCase):
+
+    def run_preflight(self, jira_probe, github_result=True, model_result=True):
+        """Run _preflight with stubbed probes; returns (result, names of probes that ran)"""
+        ran = []
+
+        class FakeJira:
+            def test_connection(self):
+                ran.append('Jira')
+                return jira_probe()
+
+        class FakeGitHub:
+            def __init__(self, token=None):
+                pass
+
+            def test_connection(self):
+                ran.append('GitHub')
+                return github_result
+
+        def test_model_connection(provider, azure_config=None):
+            ran.append('Model provider')
+            return model_result
+
+        args = main._build_parser().parse_args(['--jira-mode'])
+        with patch('jira_client.get_jira_client', return_value=FakeJira()), \
+             patch('github_client.GitHubClient', FakeGitHub), \
+             patch('ai_assistant.test_model_connection', test_model_connection), \
+             contextlib.redirect_stdout(io.StringIO()):
+            result = main._preflight(args)
+        return result, sorted(ran)
+
+    def test_all_probes_pass(self):
+        """Test that preflight passes when every service responds"""
+        result, ran = self.run_preflight(lambda: True)
+
+        self.assertTrue(result)
+        self.assertEqual(ran, ['GitHub', 'Jira', 'Model provider'])
+
+    def test_one_failing_probe_fails_preflight_without_skipping_others(self):
+        """Test that a failing or crashing probe fails preflight while the other probes still run"""
+        def unreachable():
+            raise ConnectionError("Failed to connect to Jira")
+
+        for jira_probe in (lambda: False, unreachable):
+            with self.subTest(jira_probe=jira_probe):
+                result, ran = self.run_preflight(jira_probe)
+
+                self.assertFalse(result)
+                self.assertEqual(ran, ['GitHub', 'Jira', 'Model provider'])
+
+        result, ran = self.run_preflight(lambda: True, model_result=False)
+        self.assertFalse(result)
+        self.assertEqual(ran, ['GitHub', 'Jira', 'Model provider'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,11 +8,13 @@ in a detailed, readable format.
 
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import Config
 from jira_client import JiraClient
+from main import jira_branch_name
 
 def print_header(title):
     """Print a formatted header"""
@@ -27,53 +29,48 @@ def print_section(title):
 
 def format_date(date_str):
     """Format ISO date string to readable format"""
+    if not date_str:
+        return "N/A"
+    
+    # Parse ISO format and convert to readable format
+    iso_str = date_str[:-1] + '+00:00' if date_str.endswith('Z') else date_str
     try:
-        if date_str:
-            # Parse ISO format and convert to readable format
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            return dt.strftime('%Y-%m-%d %H:%M:%S UTC')
-    except:
-        pass
-    return date_str or "N/A"
+        return datetime.fromisoformat(iso_str).strftime('%Y-%m-%d %H:%M:%S UTC')
+    except ValueError:
+        return date_str
+
+def preview(text, limit):
+    """Shorten text to limit characters, adding an ellipsis only when it was cut"""
+    return f"{text[:limit]}..." if len(text) > limit else text
 
 def print_ticket_details(ticket, index):
     """Print detailed ticket information"""
-    print(f"\n📋 Ticket #{index}: {ticket['key']}")
-    print("─" * 50)
-    print(f"Title:       {ticket['title']}")
-    print(f"Status:      {ticket['status']}")
-    print(f"Type:        {ticket['issue_type']}")
-    print(f"Assignee:    {ticket['assignee'] or 'Unassigned'}")
-    print(f"Reporter:    {ticket['reporter'] or 'Unknown'}")
-    print(f"Created:     {format_date(ticket['created'])}")
-    print(f"Updated:     {format_date(ticket['updated'])}")
-    
-    # Epic information
-    if ticket['epic_name']:
-        print(f"Epic:        {ticket['epic_name']} ({ticket['epic_key']})")
-    else:
-        print(f"Epic:        Not linked to any epic")
-    
-    # Labels
-    if ticket['labels']:
-        labels_str = ", ".join(ticket['labels'])
-        print(f"Labels:      {labels_str}")
-    else:
-        print(f"Labels:      None")
+    # Build the whole block first and print it in one call
+    lines = [
+        f"\n📋 Ticket #{index}: {ticket['key']}",
+        "─" * 50,
+        f"Title:       {ticket['title']}",
+        f"Status:      {ticket['status']}",
+        f"Type:        {ticket['issue_type']}",
+        f"Assignee:    {ticket['assignee'] or 'Unassigned'}",
+        f"Reporter:    {ticket['reporter'] or 'Unknown'}",
+        f"Created:     {format_date(ticket['created'])}",
+        f"Updated:     {format_date(ticket['updated'])}"
+    ]
     
-    # Description
-    if ticket['description'] and ticket['description'].strip():
-        desc = ticket['description'].strip()
-        # Show first 200 characters
-        if len(desc) > 200:
-            desc_preview = desc[:200] + "..."
-        else:
-            desc_preview = desc
-        print(f"Description: {desc_preview}")
-    else:
-        print(f"Description: No description provided")
+    epic_str = f"{ticket['epic_name']} ({ticket['epic_key']})" if ticket['epic_name'] else "Not linked to any epic"
+    labels_str = ", ".join(ticket['labels']) or "None"
+    # Show first 200 characters of the description
+    description = (ticket['description'] or '').strip()
+    description_str = preview(description, 200) if description else "No description provided"
     
-    print(f"URL:         {ticket['url']}")
+    lines.extend([
+        f"Epic:        {epic_str}",
+        f"Labels:      {labels_str}",
+        f"Description: {description_str}",
+        f"URL:         {ticket['url']}"
+    ])
+    print("\n".join(lines))
 
 def test_jira_connection_and_tickets():
     """Main function to test Jira and display tickets"""
@@ -123,9 +120,9 @@ def test_jira_connection_and_tickets():
         print(f"❌ Connection error: {str(e)}")
         return False
     
-    # Get user information
+    # Get user information (already fetched by test_connection)
     try:
-        user_info = jira_client.jira.myself()
+        user_info = jira_client.current_user
         print(f"👤 Logged in as: {user_info['displayName']} ({user_info['emailAddress']})")
     except Exception as e:
         print(f"⚠️  Could not get user info: {str(e)}")
@@ -133,8 +130,13 @@ def test_jira_connection_and_tickets():
     # Search for UseAI tickets
     print_section("Searching for UseAI Tickets")
     
+    # The ticket search and epic listing are independent Jira calls, so run them at the same time
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        tickets_future = executor.submit(jira_client.get_tickets_with_label, "UseAI")
+        epics_future = executor.submit(jira_client.get_all_epics)
+    
     try:
-        tickets = jira_client.get_tickets_with_label("UseAI")
+        tickets = tickets_future.result()
         
         if not tickets:
             print("ℹ️  No tickets found with 'UseAI' label")
@@ -162,12 +164,15 @@ def test_jira_connection_and_tickets():
         # Test processing functionality
         print_section("AI Processing Test")
         
-        processed_tickets = jira_client.process_useai_tickets()
+        # Reuse the tickets fetched above instead of searching again
+        processed_tickets = jira_client.process_useai_tickets(tickets)
         
         if processed_tickets:
             print(f"✅ Successfully processed {len(processed_tickets)} tickets for AI automation")
             print("\n🎯 Processed tickets ready for AI:")
             
+            # Branch names generated in one run share a single timestamp
+            timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
             for i, ticket in enumerate(processed_tickets, 1):
                 print(f"\n{i}. {ticket['jira_key']}")
                 
@@ -177,18 +182,12 @@ def test_jira_connection_and_tickets():
                 print(f"   Epic Key: {ticket['epic_key'] or 'None'}")
                 
                 # Show branch name that would be generated
-                from datetime import datetime
-                timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
-                branch_name = f"ai-dev-{ticket['jira_key']}-{timestamp}"
-                print(f"   Branch: {branch_name}")
+                print(f"   Branch: {jira_branch_name(ticket['jira_key'], timestamp)}")
                 
                 print(f"   Objective Length: {len(ticket['objective'])} characters")
                 
                 # Show objective preview
-                objective_preview = ticket['objective'][:150]
-                if len(ticket['objective']) > 150:
-                    objective_preview += "..."
-                print(f"   Objective Preview: {objective_preview}")
+                print(f"   Objective Preview: {preview(ticket['objective'], 150)}")
         else:
             print("ℹ️  No tickets ready for AI processing")
         
@@ -203,7 +202,7 @@ def test_jira_connection_and_tickets():
         print_section("Available Epics")
         
         try:
-            epics = jira_client.get_all_epics()
+            epics = epics_future.result()
             if epics:
                 print(f"📊 Found {len(epics)} epics in the project:")
                 for i, epic in enumerate(epics, 1):
@@ -43,17 +43,23 @@ class MockGitHubClient:
         return self.created_files.get(full_key, {}).get('sha', None)
 
 
+def _make_tools():
+    """Build a fresh mock GitHub client and the AITools that use it"""
+    mock_github_client = MockGitHubClient()
+    ai_tools = AITools(
+        repo_owner="test-owner",
+        repo_name="test-repo", 
+        github_client=mock_github_client,
+        branch="test-branch"
+    )
+    return mock_github_client, ai_tools
+
+
 class TestMakeDir(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures"""
-        self.mock_github_client = MockGitHubClient()
-        self.ai_tools = AITools(
-            repo_owner="test-owner",
-            repo_name="test-repo", 
-            github_client=self.mock_github_client,
-            branch="test-branch"
-        )
+        self.mock_github_client, self.ai_tools = _make_tools()
     
     def test_make_dir_success(self):
         """Test successful directory creation"""
@@ -80,21 +86,30 @@ class TestMakeDir(unittest.TestCase):
         self.assertEqual(self.ai_tools.modified_files[0]["file_path"], "new-directory/.gitkeep")
         self.assertEqual(self.ai_tools.modified_files[0]["action"], "created")
     
-    def test_make_dir_with_current_directory(self):
-        """Test directory creation with current directory context"""
-        # Set current directory
-        self.ai_tools.current_directory = "existing-dir"
-        
-        result = self.ai_tools.make_dir("sub-directory")
-        
-        # Check the result
-        self.assertTrue(result["success"])
-        self.assertEqual(result["directory_path"], "existing-dir/sub-directory")
-        self.assertEqual(result["gitkeep_file"], "existing-dir/sub-directory/.gitkeep")
-        
-        # Check that .gitkeep file was created in the right location
-        expected_key = "test-owner/test-repo/test-branch/existing-dir/sub-directory/.gitkeep"
-        self.assertIn(expected_key, self.mock_github_client.created_files)
+    def test_make_dir_path_resolution(self):
+        """Test how directory paths resolve against the current directory"""
+        # (current directory, requested path, expected directory path)
+        cases = [
+            ("existing-dir", "sub-directory", "existing-dir/sub-directory"),
+            ("", "level1/level2/level3", "level1/level2/level3"),
+            ("some-dir", "/absolute/path", "absolute/path"),
+        ]
+        
+        for current_directory, directory_path, expected_path in cases:
+            with self.subTest(current_directory=current_directory, directory_path=directory_path):
+                mock_github_client, ai_tools = _make_tools()
+                ai_tools.current_directory = current_directory
+                
+                result = ai_tools.make_dir(directory_path)
+                
+                # Check the result
+                self.assertTrue(result["success"])
+                self.assertEqual(result["directory_path"], expected_path)
+                self.assertEqual(result["gitkeep_file"], f"{expected_path}/.gitkeep")
+                
+                # Check that .gitkeep file was created in the right location
+                expected_key = f"test-owner/test-repo/test-branch/{expected_path}/.gitkeep"
+                self.assertIn(expected_key, mock_github_client.created_files)
     
     def test_make_dir_already_exists(self):
         """Test directory creation when directory already exists"""
@@ -113,30 +128,6 @@ class TestMakeDir(unittest.TestCase):
         self.assertEqual(len(self.mock_github_client.created_files), 0)
         self.assertEqual(len(self.ai_tools.modified_files), 0)
     
-    def test_make_dir_nested_path(self):
-        """Test creating nested directory structure"""
-        result = self.ai_tools.make_dir("level1/level2/level3")
-        
-        # Check the result
-        self.assertTrue(result["success"])
-        self.assertEqual(result["directory_path"], "level1/level2/level3")
-        self.assertEqual(result["gitkeep_file"], "level1/level2/level3/.gitkeep")
-        
-        # Check that .gitkeep file was created
-        expected_key = "test-owner/test-repo/test-branch/level1/level2/level3/.gitkeep"
-        self.assertIn(expected_key, self.mock_github_client.created_files)
-    
-    def test_make_dir_absolute_path(self):
-        """Test directory creation with absolute path"""
-        self.ai_tools.current_directory = "some-dir"
-        
-        result = self.ai_tools.make_dir("/absolute/path")
-        
-        # Check the result - absolute paths should strip leading slash
-        self.assertTrue(result["success"])
-        self.assertEqual(result["directory_path"], "absolute/path")
-        self.assertEqual(result["gitkeep_file"], "absolute/path/.gitkeep")
-    
     def test_make_dir_github_client_failure(self):
         """Test handling of GitHub client failure"""
         # Make the mock client fail
@@ -178,14 +169,7 @@ class TestMakeDir(unittest.TestCase):
     
     def test_make_dir_tool_schema(self):
         """Test that make_dir is included in tool schemas"""
-        schemas = self.ai_tools.get_tool_schemas()
-        
-        # Find the make_dir schema
-        make_dir_schema = None
-        for schema in schemas:
-            if schema["name"] == "make_dir":
-                make_dir_schema = schema
-                break
+        make_dir_schema = self.ai_tools.get_tool_schema("make_dir")
         
         # Check schema exists and is correct
         self.assertIsNotNone(make_dir_schema)
@@ -8,19 +8,19 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import unittest
-from unittest.mock import Mock, MagicMock
 from ai_assistant import AIAssistant
 
 
+class StubAssistant:
+    """Exposes only the PR description builder, without OpenAI or GitHub clients"""
+    _create_pr_description = AIAssistant._create_pr_description
+
+
 class TestPRDescription(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures"""
-        # Create a mock AIAssistant without actually initializing OpenAI client
-        self.assistant = Mock(spec=AIAssistant)
-        
-        # Bind the actual _create_pr_description method to our mock
-        self.assistant._create_pr_description = AIAssistant._create_pr_description.__get__(self.assistant)
+        self.assistant = StubAssistant()
     
     def test_pr_description_with_files_and_summary(self):
         """Test PR description with files and AI summary"""
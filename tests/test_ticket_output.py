@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test that parallel ticket workers' console output is tagged with their ticket
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import io
+import unittest
+from main import _TicketPrefixedStream, _output_ticket
+
+
+class TestTicketPrefixedStream(unittest.TestCase):
+
+    def setUp(self):
+        """Wrap an in-memory stream"""
+        self.buffer = io.StringIO()
+        self.stream = _TicketPrefixedStream(self.buffer)
+        self.addCleanup(setattr, _output_ticket, 'key', None)
+
+    def test_worker_lines_are_prefixed(self):
+        """Test that each complete line from a ticket worker gets the ticket key"""
+        _output_ticket.key = "REP-1"
+        print("🔄 Iteration 1", end="", file=self.stream)
+        self.assertEqual(self.buffer.getvalue(), "")
+
+        print(" done\n\nnext", file=self.stream)
+        self.assertEqual(self.buffer.getvalue(), "[REP-1] 🔄 Iteration 1 done\n\n[REP-1] next\n")
+
+    def test_flush_writes_partial_line(self):
+        """Test that flushing writes a held-back partial line with its prefix"""
+        _output_ticket.key = "REP-2"
+        self.stream.write("waiting")
+        self.stream.flush()
+
+        self.assertEqual(self.buffer.getvalue(), "[REP-2] waiting")
+
+    def test_other_threads_pass_through(self):
+        """Test that output outside a ticket worker is written unchanged"""
+        print("📋 Found 2 tickets to process", file=self.stream)
+
+        self.assertEqual(self.buffer.getvalue(), "📋 Found 2 tickets to process\n")
+
+
+if __name__ == "__main__":
+    unittest.main()